@@ -1,8 +1,9 @@
 """Telegram application assembly: handlers, error handler, polling."""
 
+import asyncio
 import logging
 
-from telegram import Update
+from telegram import BotCommand, Update
 from telegram.ext import (
     Application,
     ApplicationBuilder,
@@ -16,24 +17,41 @@ from telegram.ext import (
 from src.handlers.callbacks import button_callback
 from src.handlers.commands import cancel, list_channels, start
 from src.handlers.messages import handle_message
+from src.miniflux_api import get_client, warm_caches
 from src.settings import settings
 
 ERROR_MESSAGE = "Sorry, something went wrong while processing your request. Please try again."
 
+# The command menu shown by Telegram clients; registered once in post_init.
+BOT_COMMANDS = (
+    BotCommand("start", "Start working with the bot"),
+    BotCommand("list", "Show list of subscribed channels"),
+    BotCommand("cancel", "Cancel the current edit"),
+)
+
+# Long-poll timeout for getUpdates: Telegram holds the request open until an
+# update arrives, so a longer timeout means fewer idle round-trips.
+POLLING_TIMEOUT_SECONDS = 30
+# Only the update types the bot has handlers for; Telegram skips the rest.
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY]
+
 
 async def post_init(application: Application) -> None:
-    """Set up the bot commands after initialization."""
+    """Set up the bot commands and warm the Miniflux caches after initialization."""
     try:
-        commands = [
-            ("start", "Start working with the bot"),
-            ("list", "Show list of subscribed channels"),
-            ("cancel", "Cancel the current edit"),
-        ]
-        await application.bot.set_my_commands(commands)
+        await application.bot.set_my_commands(BOT_COMMANDS)
         logging.info("Bot commands have been set up successfully")
     except Exception as error:
         logging.error(f"Failed to set up bot commands: {error}")
 
+    # Prefetch the feed list, channel index and categories so the first message
+    # after a (re)deploy is answered from memory. A failure only costs that.
+    try:
+        await asyncio.to_thread(warm_caches, get_client())
+        logging.info("Miniflux caches have been warmed up")
+    except Exception as error:
+        logging.warning(f"Failed to warm up Miniflux caches: {error}")
+
 
 async def error_handler(update: object, context: CallbackContext) -> None:
     """Log any unhandled handler exception and let the user know something failed.
@@ -52,6 +70,9 @@ async def error_handler(update: object, context: CallbackContext) -> None:
 
 def build_application() -> Application:
     """Build the Telegram application with all handlers registered."""
+    # Updates are handled one at a time (PTB's default) on purpose: the derived
+    # feed caches in miniflux_api and the per-user edit state in user_data assume
+    # no other handler runs in between.
     builder = ApplicationBuilder().token(settings.telegram_token).post_init(post_init)
     if settings.telegram_api_server:
         # Route the Bot API through a self-hosted server where api.telegram.org is
@@ -61,9 +82,11 @@ def build_application() -> Application:
         builder = builder.base_url(f"{server}/bot").base_file_url(f"{server}/file/bot")
     application = builder.build()
 
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(CommandHandler("list", list_channels))
-    application.add_handler(CommandHandler("cancel", cancel))
+    # The bot only talks in private chats: updates from groups and channels are
+    # dropped by the dispatcher instead of reaching a handler (and its admin check).
+    application.add_handler(CommandHandler("start", start, filters=filters.ChatType.PRIVATE))
+    application.add_handler(CommandHandler("list", list_channels, filters=filters.ChatType.PRIVATE))
+    application.add_handler(CommandHandler("cancel", cancel, filters=filters.ChatType.PRIVATE))
     application.add_handler(MessageHandler(filters.ChatType.PRIVATE, handle_message))
     application.add_handler(CallbackQueryHandler(button_callback))
     application.add_error_handler(error_handler)
@@ -81,4 +104,8 @@ def run() -> None:
     logging.info("----------------------------")
 
     application = build_application()
-    application.run_polling()
+    application.run_polling(
+        timeout=POLLING_TIMEOUT_SECONDS,
+        drop_pending_updates=True,
+        allowed_updates=ALLOWED_UPDATES,
+    )
@@ -5,7 +5,7 @@ import logging
 import urllib.parse
 
 from miniflux import ClientError, ServerError
-from telegram import Update
+from telegram import InlineKeyboardMarkup, Update
 from telegram.ext import CallbackContext
 
 from src.handlers.common import clear_edit_state, safe_edit_message
@@ -32,10 +32,41 @@ a*: 0 or more, a+: 1 or more, a?: 0 or 1
 [ABC] — character A, B or C, [^ABC] — not A, B or C
             """
 
+SUBSCRIBING_MESSAGE = "⏳ Subscribing…"
+
+
+def _retry_category_keyboard(context: CallbackContext) -> InlineKeyboardMarkup | None:
+    """The category keyboard again, so a failed subscription can be retried with one tap.
+
+    The pending feed stays in user_data after a failure; the keyboard is rebuilt
+    from the id -> title mapping stored when the categories were first shown.
+    """
+    categories = context.user_data.get("categories")
+    if not categories:
+        return None
+    reply_markup, _ = build_category_keyboard(
+        [{"id": cat_id, "title": title} for cat_id, title in categories.items()]
+    )
+    return reply_markup
+
+
+async def _find_channel_feed(query, client, channel_name: str) -> dict | None:
+    """Look up the subscribed feed of a channel.
+
+    When the channel is not subscribed (or its feed has no id), the message is
+    edited to say so and None is returned: the caller just returns.
+    """
+    target_feed = await asyncio.to_thread(find_feed_by_channel, client, channel_name)
+    if not target_feed or not target_feed.get("id"):
+        logging.warning("No feed found for channel %s.", channel_name)
+        await safe_edit_message(query, f"Channel @{channel_name} not found in subscriptions.")
+        return None
+    return target_feed
+
 
 async def _handle_flag_toggle(query, _context: CallbackContext, action: str, flag: str, channel_name: str):
     """Handles the logic for adding or removing a flag based on button press."""
-    logging.info(f"Processing flag toggle: Action='{action}', Flag='{flag}', Channel='{channel_name}'")
+    logging.info("Processing flag toggle: Action='%s', Flag='%s', Channel='%s'", action, flag, channel_name)
 
     current_flags_on_error: list[str] = []
     current_merge_seconds_on_error = None
@@ -44,15 +75,13 @@ async def _handle_flag_toggle(query, _context: CallbackContext, action: str, fla
         client = get_client()
         # Resolve the feed from Miniflux by channel name: user_data does not survive
         # a restart, and the bot is restarted on every deployment.
-        target_feed = await asyncio.to_thread(find_feed_by_channel, client, channel_name)
+        target_feed = await _find_channel_feed(query, client, channel_name)
         if not target_feed:
-            logging.error(f"No feed found for channel {channel_name} during flag toggle.")
-            await safe_edit_message(query, f"Channel @{channel_name} not found in subscriptions.")
             return
 
-        feed_id = target_feed.get("id")
+        feed_id = target_feed["id"]
         current_url = target_feed.get("feed_url", "")
-        if not feed_id or not current_url:
+        if not current_url:
             logging.error(f"Could not retrieve current URL for channel {channel_name}. Cannot toggle flag.")
             await safe_edit_message(query, f"Error: Could not get current feed details for @{channel_name}.")
             return
@@ -112,10 +141,10 @@ async def _handle_flag_toggle(query, _context: CallbackContext, action: str, fla
             merge_seconds=current_merge_seconds,
         )
 
-        logging.info(f"Attempting flag update. Old flags: {current_flags}, New flags: {new_flags}. Target URL: {new_url}")
+        logging.info("Attempting flag update. Old flags: %s, New flags: %s. Target URL: %s", current_flags, new_flags, new_url)
 
         success, _updated_url, error_message = await asyncio.to_thread(
-            update_feed_url, feed_id, new_url, client
+            update_feed_url, feed_id, new_url, client, current_url
         )
 
         if not success:
@@ -216,10 +245,14 @@ async def _handle_category_selection(query, context: CallbackContext, data: str)
 
         await query.message.chat.send_action("typing")
         try:
-            logging.info(f"Subscribing to direct RSS feed '{feed_url}' in category {cat_id}")
+            # Miniflux fetches the feed before answering, which can take seconds: show
+            # progress and drop the category buttons so a second tap cannot re-subscribe.
+            await safe_edit_message(query, SUBSCRIBING_MESSAGE)
+            logging.info("Subscribing to direct RSS feed '%s' in category %s", feed_url, cat_id)
             await asyncio.to_thread(create_feed, client, feed_url, cat_id)
             # Clear the pending URL only after a successful subscription, so a failed
-            # attempt can be retried without the user re-sending the link.
+            # attempt can be retried (the failure message brings the categories back)
+            # without the user re-sending the link.
             context.user_data.pop("direct_rss_url", None)
             category_title = context.user_data.get("categories", {}).get(cat_id, "Unknown")
             await safe_edit_message(
@@ -230,10 +263,18 @@ async def _handle_category_selection(query, context: CallbackContext, data: str)
         except (ClientError, ServerError) as error:
             error_message = format_miniflux_error(error)
             logging.error(f"Miniflux API error while subscribing to feed '{feed_url}': {error_message}")
-            await safe_edit_message(query, f"Failed to subscribe to RSS feed '{feed_url}': {error_message}")
+            await safe_edit_message(
+                query,
+                f"Failed to subscribe to RSS feed '{feed_url}': {error_message}",
+                reply_markup=_retry_category_keyboard(context),
+            )
         except Exception as error:
             logging.error(f"Unexpected error while subscribing to feed '{feed_url}': {str(error)}", exc_info=True)
-            await safe_edit_message(query, f"Unexpected error while subscribing to RSS feed: {str(error)}")
+            await safe_edit_message(
+                query,
+                f"Unexpected error while subscribing to RSS feed: {str(error)}",
+                reply_markup=_retry_category_keyboard(context),
+            )
         return
 
     # --- Telegram channel subscription ---
@@ -247,7 +288,8 @@ async def _handle_category_selection(query, context: CallbackContext, data: str)
 
     await query.message.chat.send_action("typing")
     try:
-        logging.info(f"Subscribing to feed '{feed_url}' in category {cat_id}")
+        await safe_edit_message(query, SUBSCRIBING_MESSAGE)
+        logging.info("Subscribing to feed '%s' in category %s", feed_url, cat_id)
         await asyncio.to_thread(create_feed, client, feed_url, cat_id)
         context.user_data.pop("channel_title", None)
         category_title = context.user_data.get("categories", {}).get(cat_id, "Unknown")
@@ -259,10 +301,18 @@ async def _handle_category_selection(query, context: CallbackContext, data: str)
     except (ClientError, ServerError) as error:
         error_message = format_miniflux_error(error)
         logging.error(f"Miniflux API error while subscribing to feed '{feed_url}': {error_message}")
-        await safe_edit_message(query, f"Failed to subscribe to RSS feed '{feed_url}': {error_message}")
+        await safe_edit_message(
+            query,
+            f"Failed to subscribe to RSS feed '{feed_url}': {error_message}",
+            reply_markup=_retry_category_keyboard(context),
+        )
     except Exception as error:
         logging.error(f"Unexpected error while subscribing to feed '{feed_url}': {str(error)}", exc_info=True)
-        await safe_edit_message(query, f"Unexpected error while subscribing to RSS feed: {str(error)}")
+        await safe_edit_message(
+            query,
+            f"Unexpected error while subscribing to RSS feed: {str(error)}",
+            reply_markup=_retry_category_keyboard(context),
+        )
 
 
 async def _handle_delete_channel(query, channel_name: str):
@@ -270,13 +320,12 @@ async def _handle_delete_channel(query, channel_name: str):
     client = get_client()
     await query.message.chat.send_action("typing")
     try:
-        target_feed = await asyncio.to_thread(find_feed_by_channel, client, channel_name)
+        target_feed = await _find_channel_feed(query, client, channel_name)
         if not target_feed:
-            await safe_edit_message(query, f"Channel @{channel_name} not found in subscriptions.")
             return
 
         # The Miniflux client is synchronous: it must be called in a worker thread.
-        success, error_message = await asyncio.to_thread(delete_feed, client, target_feed.get("id"))
+        success, error_message = await asyncio.to_thread(delete_feed, client, target_feed["id"])
         if not success:
             await safe_edit_message(query, f"Failed to delete channel: {error_message}")
             return
@@ -297,14 +346,12 @@ async def _handle_manage_channel(query, _context: CallbackContext, channel_name:
     client = get_client()
     await query.message.chat.send_action("typing")
     try:
-        target_feed = await asyncio.to_thread(find_feed_by_channel, client, channel_name)
+        target_feed = await _find_channel_feed(query, client, channel_name)
         if not target_feed:
-            await safe_edit_message(query, f"Channel @{channel_name} not found in subscriptions.")
             return
 
-        feed_id = target_feed.get("id")
-        current_feed = await asyncio.to_thread(client.get_feed, feed_id)
-        parsed_current = parse_feed_url(current_feed.get("feed_url", ""))
+        # The feed list entry already carries the URL: no extra get_feed round-trip
+        parsed_current = parse_feed_url(target_feed.get("feed_url", ""))
         current_flags = parsed_current.get("flags") or []
         current_merge_seconds = parsed_current.get("merge_seconds")
 
@@ -327,28 +374,23 @@ async def _handle_edit_regex(query, context: CallbackContext, channel_name: str)
     client = get_client()
     await query.message.chat.send_action("typing")
     try:
-        target_feed = await asyncio.to_thread(find_feed_by_channel, client, channel_name)
-        feed_id = target_feed.get("id") if target_feed else None
-
-        if not target_feed or not feed_id:
-            logging.warning(f"Target feed or feed_id not found for {channel_name} after searching feeds.")
-            await safe_edit_message(
-                query, f"Channel @{channel_name} not found in subscriptions or feed ID missing."
-            )
+        target_feed = await _find_channel_feed(query, client, channel_name)
+        if not target_feed:
             return
+        feed_id = target_feed["id"]
 
         parsed_data = parse_feed_url(target_feed.get("feed_url", ""))
         current_regex = parsed_data.get("exclude_text") or ""
 
         if current_regex:
-            logging.info(f"Found current regex for {channel_name}: '{current_regex}'")
+            logging.info("Found current regex for %s: '%s'", channel_name, current_regex)
         else:
-            logging.info(f"No current exclude_text regex found for {channel_name}")
+            logging.info("No current exclude_text regex found for %s", channel_name)
 
         context.user_data['state'] = 'awaiting_regex'
         context.user_data['editing_regex_for_channel'] = channel_name
         context.user_data['editing_feed_id'] = feed_id
-        logging.info(f"Set state to 'awaiting_regex' for channel {channel_name} (feed ID: {feed_id})")
+        logging.info("Set state to 'awaiting_regex' for channel %s (feed ID: %s)", channel_name, feed_id)
 
         if current_regex:
             prompt_message = (
@@ -380,28 +422,23 @@ async def _handle_edit_merge_time(query, context: CallbackContext, channel_name:
     client = get_client()
     await query.message.chat.send_action("typing")
     try:
-        target_feed = await asyncio.to_thread(find_feed_by_channel, client, channel_name)
-        feed_id = target_feed.get("id") if target_feed else None
-
-        if not target_feed or not feed_id:
-            logging.warning(f"Target feed or feed_id not found for {channel_name} after searching feeds.")
-            await safe_edit_message(
-                query, f"Channel @{channel_name} not found in subscriptions or feed ID missing."
-            )
+        target_feed = await _find_channel_feed(query, client, channel_name)
+        if not target_feed:
             return
+        feed_id = target_feed["id"]
 
         parsed_data = parse_feed_url(target_feed.get("feed_url", ""))
         current_merge_seconds = parsed_data.get("merge_seconds")
 
         if current_merge_seconds is not None:
-            logging.info(f"Found current merge_seconds for {channel_name}: {current_merge_seconds}")
+            logging.info("Found current merge_seconds for %s: %s", channel_name, current_merge_seconds)
         else:
-            logging.info(f"No current merge_seconds found for {channel_name}")
+            logging.info("No current merge_seconds found for %s", channel_name)
 
         context.user_data['state'] = 'awaiting_merge_time'
         context.user_data['editing_merge_time_for_channel'] = channel_name
         context.user_data['editing_feed_id'] = feed_id
-        logging.info(f"Set state to 'awaiting_merge_time' for channel {channel_name} (feed ID: {feed_id})")
+        logging.info("Set state to 'awaiting_merge_time' for channel %s (feed ID: %s)", channel_name, feed_id)
 
         prompt_message = f"Editing merge time for @{channel_name}.\n"
         if current_merge_seconds is not None:
@@ -462,5 +499,5 @@ async def button_callback(update: Update, context: CallbackContext):
         await _handle_edit_merge_time(query, context, data.split("|", 1)[1])
 
     else:
-        logging.warning(f"Received unknown callback query data: {data}")
+        logging.warning("Received unknown callback query data: %s", data)
         await safe_edit_message(query, "Unknown action.")
@@ -69,35 +69,60 @@ def _build_category_messages(cat_title: str, feeds_in_cat: list[dict]) -> list[t
     keyboard whose buttons match exactly the feeds shown in that message.
     """
     header = f"📁 {cat_title}\n"
-    continued_header = f"📁 {cat_title} (continued)\n"
     lines = [_format_feed_line(feed_item) for feed_item in feeds_in_cat]
 
     full_message = header + "".join(lines)
     if len(full_message) <= MAX_MESSAGE_LENGTH and len(feeds_in_cat) <= MAX_CHANNELS_PER_MESSAGE:
         return [(full_message, list(feeds_in_cat))]
 
+    # Only a split category needs the continuation header. The title is plain
+    # text (no parse_mode), so it is used as is, without any escaping.
+    continued_header = f"📁 {cat_title} (continued)\n"
+
+    # Collect each message as a list of parts with a running length and join it
+    # once, instead of growing a string with += (quadratic in the text size).
     chunks: list[tuple[str, list[dict]]] = []
-    current_text = header
+    current_parts = [header]
+    current_size = len(header)
     current_feeds: list[dict] = []
     for feed_item, line in zip(feeds_in_cat, lines, strict=True):
         # Split on either the character limit or the per-message button budget.
         if current_feeds and (
-            len(current_text) + len(line) > MAX_MESSAGE_LENGTH
+            current_size + len(line) > MAX_MESSAGE_LENGTH
             or len(current_feeds) >= MAX_CHANNELS_PER_MESSAGE
         ):
-            chunks.append((current_text, current_feeds))
-            current_text = continued_header
+            chunks.append(("".join(current_parts), current_feeds))
+            current_parts = [continued_header]
+            current_size = len(continued_header)
             current_feeds = []
-        current_text += line
+        current_parts.append(line)
+        current_size += len(line)
         current_feeds.append(feed_item)
 
     # Append the tail chunk unless it holds nothing but the continuation header
-    if len(current_text.strip()) > len(continued_header.strip()):
-        chunks.append((current_text, current_feeds))
+    if current_feeds:
+        chunks.append(("".join(current_parts), current_feeds))
 
     return chunks
 
 
+async def _send_category(message, cat_title: str, feeds_in_cat: list[dict]) -> None:
+    """Send one category, in order, as one or more messages with manage buttons."""
+    for text, feeds_in_msg in _build_category_messages(cat_title, feeds_in_cat):
+        # One management button per feed that carries a channel name.
+        buttons = [
+            [InlineKeyboardButton(
+                f"⚙️ {feed['title']}", callback_data=f"manage|{feed['channel']}"
+            )]
+            for feed in feeds_in_msg
+            if feed.get("channel")
+        ]
+        if buttons:
+            await message.reply_text(text, reply_markup=InlineKeyboardMarkup(buttons))
+        else:
+            await message.reply_text(text)
+
+
 async def list_channels(update: Update, context: CallbackContext):
     """
     Handle the /list command.
@@ -122,20 +147,10 @@ async def list_channels(update: Update, context: CallbackContext):
 
         await update.message.reply_text("Subscribed channels by category:")
 
+        # One after another: the listing keeps its sorted order and a burst to a
+        # single chat would run into Telegram's per-chat flood limit.
         for cat_title, feeds_in_cat in channels_by_category.items():
-            for text, feeds_in_msg in _build_category_messages(cat_title, feeds_in_cat):
-                # One management button per feed that carries a channel name.
-                buttons = [
-                    [InlineKeyboardButton(
-                        f"⚙️ {feed['title']}", callback_data=f"manage|{feed['channel']}"
-                    )]
-                    for feed in feeds_in_msg
-                    if feed.get("channel")
-                ]
-                if buttons:
-                    await update.message.reply_text(text, reply_markup=InlineKeyboardMarkup(buttons))
-                else:
-                    await update.message.reply_text(text)
+            await _send_category(update.message, cat_title, feeds_in_cat)
 
     except Exception as error:
         logging.error(f"Failed to list channels: {error}", exc_info=True)
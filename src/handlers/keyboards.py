@@ -1,8 +1,10 @@
 """Inline keyboards and the cached list of flags supported by the RSS bridge."""
 
 import asyncio
+import functools
 import logging
 import time
+from collections.abc import Collection, Iterable
 
 import requests
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
@@ -15,10 +17,22 @@ FLAGS_CACHE_TTL_SECONDS = 300
 # A failed fetch is cached for a shorter time so the bridge recovers quickly.
 FLAGS_CACHE_FAILURE_TTL_SECONDS = 30
 
+# Flag toggles are laid out in rows of this many buttons.
+FLAG_BUTTONS_PER_ROW = 2
+
+# Distinct (channel, flag state) options keyboards kept in memory.
+OPTIONS_MARKUP_CACHE_SIZE = 256
+
 FLAGS_UNAVAILABLE_NOTE = "\n\n⚠️ Flag list is temporarily unavailable, flag buttons are hidden."
 
-# Module-level cache: (timestamp, flags)
-_flags_cache: tuple[float, list[str]] | None = None
+# Module-level cache: (timestamp, flags). The flags are kept as a tuple: it is
+# what the memoized options markup is keyed by, so a button press reuses the
+# cached tuple instead of copying the list every time.
+_flags_cache: tuple[float, tuple[str, ...]] | None = None
+
+# The last category list and the keyboard built from it: fetch_categories hands
+# back the same cached list, so the keyboard is rebuilt only when it changes.
+_category_keyboard_cache: tuple[list[dict], InlineKeyboardMarkup, dict] | None = None
 
 
 def fetch_available_flags(base_url: str | None) -> list[str]:
@@ -74,7 +88,7 @@ def fetch_available_flags(base_url: str | None) -> list[str]:
         return []
 
 
-async def get_available_flags() -> list[str]:
+async def get_available_flags() -> tuple[str, ...]:
     """Return the available flags, fetching them off the event loop and caching them."""
     global _flags_cache
 
@@ -85,16 +99,61 @@ async def get_available_flags() -> list[str]:
         if now - cached_at < ttl:
             return cached_flags
 
-    flags = await asyncio.to_thread(fetch_available_flags, settings.rss_bridge_url)
+    flags = tuple(await asyncio.to_thread(fetch_available_flags, settings.rss_bridge_url))
     _flags_cache = (time.monotonic(), flags)
     return flags
 
 
+def _flag_button(channel_username: str, flag: str, is_set: bool) -> InlineKeyboardButton:
+    """Build the toggle button for one flag: "Remove" when it is set, "Add" otherwise."""
+    if is_set:
+        return InlineKeyboardButton(f"❌ Remove \"{flag}\"", callback_data=f"remove_flag|{channel_username}|{flag}")
+    return InlineKeyboardButton(f"✅ Add \"{flag}\"", callback_data=f"add_flag|{channel_username}|{flag}")
+
+
+def _options_rows(
+    channel_username: str,
+    current_flags: Collection[str],
+    current_merge_seconds: int | None,
+    available_flags: Iterable[str],
+) -> list[list[InlineKeyboardButton]]:
+    """Lay out the flag toggles followed by the regex, merge time and delete rows."""
+    # Build every toggle first, then slice into rows of FLAG_BUTTONS_PER_ROW.
+    buttons = [_flag_button(channel_username, flag, flag in current_flags) for flag in available_flags]
+    keyboard: list[list[InlineKeyboardButton]] = [
+        buttons[i:i + FLAG_BUTTONS_PER_ROW] for i in range(0, len(buttons), FLAG_BUTTONS_PER_ROW)
+    ]
+
+    keyboard.append([InlineKeyboardButton("Edit Regex", callback_data=f"edit_regex|{channel_username}")])
+
+    merge_time_text = "Edit Merge Time"
+    if current_merge_seconds is not None:
+        merge_time_text += f" ({current_merge_seconds}s)"
+    keyboard.append([InlineKeyboardButton(merge_time_text, callback_data=f"edit_merge_time|{channel_username}")])
+
+    keyboard.append([InlineKeyboardButton("Delete channel", callback_data=f"delete|{channel_username}")])
+
+    return keyboard
+
+
+@functools.lru_cache(maxsize=OPTIONS_MARKUP_CACHE_SIZE)
+def _options_markup(
+    channel_username: str,
+    current_flags: frozenset[str],
+    current_merge_seconds: int | None,
+    available_flags: tuple[str, ...],
+) -> InlineKeyboardMarkup:
+    """The options markup for one channel state, memoized (markups are immutable)."""
+    return InlineKeyboardMarkup(
+        _options_rows(channel_username, current_flags, current_merge_seconds, available_flags)
+    )
+
+
 async def create_flag_keyboard(
     channel_username: str,
     current_flags: list[str] | None,
     current_merge_seconds: int | None = None,
-    available_flags: list[str] | None = None,
+    available_flags: Iterable[str] | None = None,
 ) -> list[list[InlineKeyboardButton]]:
     """
     Create the channel options keyboard: a toggle per available flag (✅/❌),
@@ -109,36 +168,10 @@ async def create_flag_keyboard(
     Returns:
         list: Keyboard buttons.
     """
-    current_flags = current_flags or []
     all_flags = available_flags if available_flags is not None else await get_available_flags()
-
-    keyboard: list[list[InlineKeyboardButton]] = []
-    row: list[InlineKeyboardButton] = []
-
-    for i, flag in enumerate(all_flags):
-        if flag in current_flags:
-            button_text = f"❌ Remove \"{flag}\""
-            callback_action = f"remove_flag|{channel_username}|{flag}"
-        else:
-            button_text = f"✅ Add \"{flag}\""
-            callback_action = f"add_flag|{channel_username}|{flag}"
-
-        row.append(InlineKeyboardButton(button_text, callback_data=callback_action))
-
-        if len(row) == 2 or i == len(all_flags) - 1:
-            keyboard.append(row)
-            row = []
-
-    keyboard.append([InlineKeyboardButton("Edit Regex", callback_data=f"edit_regex|{channel_username}")])
-
-    merge_time_text = "Edit Merge Time"
-    if current_merge_seconds is not None:
-        merge_time_text += f" ({current_merge_seconds}s)"
-    keyboard.append([InlineKeyboardButton(merge_time_text, callback_data=f"edit_merge_time|{channel_username}")])
-
-    keyboard.append([InlineKeyboardButton("Delete channel", callback_data=f"delete|{channel_username}")])
-
-    return keyboard
+    # A set once, so each flag's "is it enabled" check is a hash lookup (and
+    # duplicate flags parsed from the URL collapse).
+    return _options_rows(channel_username, frozenset(current_flags or ()), current_merge_seconds, all_flags)
 
 
 async def build_options_view(
@@ -150,21 +183,28 @@ async def build_options_view(
 
     Returns the markup and a note to append to the message text: the note warns
     the user when the flag list could not be fetched and flag buttons are hidden.
+    The markup depends only on the channel, the set of enabled flags, the merge
+    time and the available flags, so it is reused for a repeated state.
     """
     available_flags = await get_available_flags()
-    keyboard = await create_flag_keyboard(
-        channel_username, current_flags, current_merge_seconds, available_flags=available_flags
+    markup = _options_markup(
+        channel_username, frozenset(current_flags or ()), current_merge_seconds, available_flags
     )
     note = "" if available_flags else FLAGS_UNAVAILABLE_NOTE
-    return InlineKeyboardMarkup(keyboard), note
+    return markup, note
 
 
 def build_category_keyboard(categories: list[dict]) -> tuple[InlineKeyboardMarkup, dict]:
     """Build the category selection keyboard.
 
     Returns the markup and the id -> title mapping the caller stores in user_data
-    (it is needed to name the category in the confirmation message).
+    (it is needed to name the category in the confirmation message). Both are
+    reused while the same category list is passed in; callers must not mutate them.
     """
+    global _category_keyboard_cache
+    if _category_keyboard_cache is not None and _category_keyboard_cache[0] is categories:
+        return _category_keyboard_cache[1], _category_keyboard_cache[2]
+
     keyboard = []
     categories_dict = {}
     for category in categories:
@@ -172,4 +212,6 @@ def build_category_keyboard(categories: list[dict]) -> tuple[InlineKeyboardMarku
         cat_id = category.get("id")
         categories_dict[cat_id] = cat_title
         keyboard.append([InlineKeyboardButton(cat_title, callback_data=f"cat_{cat_id}")])
-    return InlineKeyboardMarkup(keyboard), categories_dict
+    markup = InlineKeyboardMarkup(keyboard)
+    _category_keyboard_cache = (categories, markup, categories_dict)
+    return markup, categories_dict
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import re
+from collections import OrderedDict
 from typing import NamedTuple
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
@@ -15,12 +16,30 @@ from src.miniflux_api import (
     fetch_categories,
     find_feed_by_channel,
     get_client,
+    get_feed_by_id,
     update_feed_url,
 )
 from src.settings import should_accept_channels_without_username
 from src.url_constructor import build_feed_url, parse_feed_url
 from src.url_utils import is_valid_rss_url, parse_telegram_link
 
+# A direct "@channelname" mention at the start of the message.
+USERNAME_MENTION_RE = re.compile(r"@([a-zA-Z0-9_]+)")
+
+# An album arrives as several messages sharing a media_group_id; only the first
+# is processed. The ids already handled are remembered in a bounded, oldest-first
+# map, so a second album arriving before the first is finished is not forgotten.
+MEDIA_GROUP_MEMORY_SIZE = 512
+_processed_media_groups: OrderedDict[str, None] = OrderedDict()
+
+
+def _mark_media_group_processed(media_group_id: str) -> None:
+    """Remember a media group as handled, evicting the oldest beyond the bound."""
+    _processed_media_groups[media_group_id] = None
+    _processed_media_groups.move_to_end(media_group_id)
+    while len(_processed_media_groups) > MEDIA_GROUP_MEMORY_SIZE:
+        _processed_media_groups.popitem(last=False)
+
 
 class ParsedMessage(NamedTuple):
     """Result of parsing an incoming message.
@@ -36,17 +55,24 @@ class ParsedMessage(NamedTuple):
     html_rss_links: list | None = None
 
 
-async def _reply_with_options_keyboard(update: Update, channel_name: str, feed_id: int, text: str) -> None:
-    """Re-fetch the feed and show the options keyboard for the channel."""
+async def _reply_with_options_keyboard(
+    update: Update, channel_name: str, feed_id: int, text: str, feed_url: str | None = None
+) -> None:
+    """Show the options keyboard for the channel.
+
+    A caller that has just written the feed URL passes it in; otherwise the feed
+    is looked up (from the cached feed list when possible).
+    """
     try:
-        client = get_client()
-        feed = await asyncio.to_thread(client.get_feed, feed_id)
-        parsed = parse_feed_url(feed.get("feed_url", ""))
+        if feed_url is None:
+            feed = await asyncio.to_thread(get_feed_by_id, get_client(), feed_id)
+            feed_url = feed.get("feed_url", "")
+        parsed = parse_feed_url(feed_url)
         reply_markup, flags_note = await build_options_view(
             channel_name, parsed.get("flags") or [], parsed.get("merge_seconds")
         )
         await update.message.reply_text(f"{text}{flags_note}", reply_markup=reply_markup)
-        logging.info(f"Displayed options keyboard for {channel_name}.")
+        logging.info("Displayed options keyboard for %s.", channel_name)
     except Exception as error:
         logging.error(f"Failed to fetch flags/show keyboard for {channel_name}: {error}")
 
@@ -56,20 +82,24 @@ _KEEP = object()
 
 
 async def _rebuild_and_update_feed(client, feed_id, channel_name, *, exclude_text=_KEEP, merge_seconds=_KEEP):
-    """Fetch feed, override one field in its URL, push the update.
+    """Look up the feed, override one field in its URL, push the update.
 
-    Returns (status, error_message). status is one of:
-    'ok' | 'no_url' | 'no_base_url' | 'update_failed'. error_message is set for 'update_failed'.
-    The get_feed / update calls may raise: the caller catches those.
+    The feed is read from the cached feed list (get_feed_by_id), which falls back
+    to a get_feed call only when the feed is not in the cache.
+
+    Returns (status, error_message, new_url). status is one of:
+    'ok' | 'no_url' | 'no_base_url' | 'update_failed'. error_message is set for
+    'update_failed'; new_url is the URL written to Miniflux for 'ok'.
+    The feed lookup / update calls may raise: the caller catches those.
     """
-    current_feed_data = await asyncio.to_thread(client.get_feed, feed_id)
+    current_feed_data = await asyncio.to_thread(get_feed_by_id, client, feed_id)
     current_url = current_feed_data.get("feed_url", "")
     if not current_url:
-        return ("no_url", None)
+        return ("no_url", None, None)
     parsed = parse_feed_url(current_url)
     base = parsed.get("base_url")
     if not base:
-        return ("no_base_url", None)
+        return ("no_base_url", None, None)
     new_url = build_feed_url(
         base_url=base,
         channel_name=channel_name,
@@ -77,8 +107,8 @@ async def _rebuild_and_update_feed(client, feed_id, channel_name, *, exclude_tex
         exclude_text=parsed.get("exclude_text") if exclude_text is _KEEP else exclude_text,
         merge_seconds=parsed.get("merge_seconds") if merge_seconds is _KEEP else merge_seconds,
     )
-    success, _url, err = await asyncio.to_thread(update_feed_url, feed_id, new_url, client)
-    return ("ok", None) if success else ("update_failed", err)
+    success, _url, err = await asyncio.to_thread(update_feed_url, feed_id, new_url, client, current_url)
+    return ("ok", None, new_url) if success else ("update_failed", err, None)
 
 
 async def _handle_awaiting_regex(update: Update, context: CallbackContext):
@@ -90,7 +120,7 @@ async def _handle_awaiting_regex(update: Update, context: CallbackContext):
 
     # Clean up state regardless of success/failure below
     clear_edit_state(context)
-    logging.info(f"Processing new regex for channel {channel_name} (feed ID: {feed_id}). State cleared.")
+    logging.info("Processing new regex for channel %s (feed ID: %s). State cleared.", channel_name, feed_id)
 
     if not channel_name or not feed_id:
         logging.error("State 'awaiting_regex' was set, but channel_name or feed_id missing from context.")
@@ -105,7 +135,7 @@ async def _handle_awaiting_regex(update: Update, context: CallbackContext):
 
     try:
         client = get_client()
-        status, error_message = await _rebuild_and_update_feed(
+        status, error_message, new_url = await _rebuild_and_update_feed(
             client, feed_id, channel_name, exclude_text=regex_to_store
         )
 
@@ -134,7 +164,7 @@ async def _handle_awaiting_regex(update: Update, context: CallbackContext):
             await msg.reply_text(f"Regex for channel @{channel_name} updated to: {regex_to_store}")
 
         await _reply_with_options_keyboard(
-            update, channel_name, feed_id, f"Updated options for @{channel_name}. Choose an action:"
+            update, channel_name, feed_id, f"Updated options for @{channel_name}. Choose an action:", new_url
         )
 
     except Exception as error:
@@ -176,18 +206,18 @@ async def _handle_awaiting_merge_time(update: Update, context: CallbackContext):
     # An empty input or 0 removes the merge time
     if new_merge_seconds_to_set == 0:
         new_merge_seconds_to_set = None
-        logging.info(f"Received input to remove merge time for {channel_name}.")
+        logging.info("Received input to remove merge time for %s.", channel_name)
     else:
-        logging.info(f"Received new merge time for {channel_name}: {new_merge_seconds_to_set} seconds.")
+        logging.info("Received new merge time for %s: %s seconds.", channel_name, new_merge_seconds_to_set)
 
     clear_edit_state(context)
-    logging.info(f"Processing new merge time for channel {channel_name} (feed ID: {feed_id}). State cleared.")
+    logging.info("Processing new merge time for channel %s (feed ID: %s). State cleared.", channel_name, feed_id)
 
     await msg.chat.send_action("typing")
 
     try:
         client = get_client()
-        status, error_message = await _rebuild_and_update_feed(
+        status, error_message, new_url = await _rebuild_and_update_feed(
             client, feed_id, channel_name, merge_seconds=new_merge_seconds_to_set
         )
 
@@ -220,7 +250,7 @@ async def _handle_awaiting_merge_time(update: Update, context: CallbackContext):
             )
 
         await _reply_with_options_keyboard(
-            update, channel_name, feed_id, f"Updated options for @{channel_name}. Choose an action:"
+            update, channel_name, feed_id, f"Updated options for @{channel_name}. Choose an action:", new_url
         )
 
     except Exception as error:
@@ -237,15 +267,19 @@ async def _parse_message_content(update: Update, context: CallbackContext) -> Pa
     forward_chat = msg_dict.get("forward_from_chat")
     if forward_chat:
         if forward_chat["type"] != "channel":
-            logging.info(f"Forwarded message is from {forward_chat['type']}, not from channel")
+            logging.info("Forwarded message is from %s, not from channel", forward_chat['type'])
             await msg.reply_text("Please forward a message from a channel, not from other source.")
             return ParsedMessage(handled=True)
 
-        logging.info(f"Processing forwarded message from channel: {forward_chat.get('username') or forward_chat.get('id')}")
+        logging.info(
+            "Processing forwarded message from channel: %s", forward_chat.get('username') or forward_chat.get('id')
+        )
         accept_no_username = should_accept_channels_without_username()
-        logging.info(f"Value of ACCEPT_CHANNELS_WITHOUT_USERNAME: {accept_no_username}")
+        logging.info("Value of ACCEPT_CHANNELS_WITHOUT_USERNAME: %s", accept_no_username)
         if not forward_chat.get("username") and not accept_no_username:
-            logging.error(f"Channel {forward_chat['title']} has no username and ACCEPT_CHANNELS_WITHOUT_USERNAME is false.")
+            logging.error(
+                "Channel %s has no username and ACCEPT_CHANNELS_WITHOUT_USERNAME is false.", forward_chat['title']
+            )
             await msg.reply_text(
                 "Error: channel must have a public username to subscribe. \n"
                 "Use env ACCEPT_CHANNELS_WITHOUT_USERNAME=true to accept channels without username "
@@ -257,8 +291,8 @@ async def _parse_message_content(update: Update, context: CallbackContext) -> Pa
         # If this is part of a media group from a forward, mark it as processed
         media_group_id = msg.media_group_id
         if media_group_id:
-            context.user_data["processed_media_group_id"] = media_group_id
-            logging.info(f"Processing first forwarded message from media group {media_group_id}")
+            _mark_media_group_processed(media_group_id)
+            logging.info("Processing first forwarded message from media group %s", media_group_id)
 
         return ParsedMessage(channel_username=channel_username, channel_source_type='forward')
 
@@ -269,34 +303,34 @@ async def _parse_message_content(update: Update, context: CallbackContext) -> Pa
         parsed_channel = None
         if text.startswith('@'):
             # Direct username mention (e.g. @channelname)
-            match_username = re.match(r"@([a-zA-Z0-9_]+)", text)
+            match_username = USERNAME_MENTION_RE.match(text)
             if match_username:
                 parsed_channel = match_username.group(1)
-                logging.info(f"Processing direct username: {parsed_channel}")
+                logging.info("Processing direct username: %s", parsed_channel)
         else:
             parsed_channel = parse_telegram_link(text)
 
         if parsed_channel:
-            logging.info(f"Processing Telegram channel identified as: {parsed_channel}")
+            logging.info("Processing Telegram channel identified as: %s", parsed_channel)
             media_group_id = msg.media_group_id
             if media_group_id:
-                context.user_data["processed_media_group_id"] = media_group_id
-                logging.info(f"Processing first linked message from media group {media_group_id}")
+                _mark_media_group_processed(media_group_id)
+                logging.info("Processing first linked message from media group %s", media_group_id)
             return ParsedMessage(channel_username=parsed_channel, channel_source_type='link_or_username')
 
         # Not a Telegram link: check whether it is a direct RSS/HTML URL
         if text.startswith('http://') or text.startswith('https://'):
             url = text
-            logging.info(f"Checking if URL is a valid RSS feed or contains RSS links: {url}")
+            logging.info("Checking if URL is a valid RSS feed or contains RSS links: %s", url)
             await msg.chat.send_action("typing")
             is_direct_rss, result = await asyncio.to_thread(is_valid_rss_url, url)
 
             if is_direct_rss:
-                logging.info(f"URL is a direct RSS feed: {result}")
+                logging.info("URL is a direct RSS feed: %s", result)
                 return ParsedMessage(direct_rss_url=result)
 
             if isinstance(result, list) and result:
-                logging.info(f"Found {len(result)} RSS links in the webpage")
+                logging.info("Found %d RSS links in the webpage", len(result))
                 return ParsedMessage(html_rss_links=result)
 
     # Nothing recognized
@@ -306,7 +340,7 @@ async def _parse_message_content(update: Update, context: CallbackContext) -> Pa
 async def _handle_telegram_channel(update: Update, context: CallbackContext, channel_username: str, channel_source_type: str):
     """Handles logic for processing a detected Telegram channel."""
     context.user_data["channel_title"] = channel_username
-    logging.info(f"Processing Telegram channel identified as: {channel_username} (Source: {channel_source_type})")
+    logging.info("Processing Telegram channel identified as: %s (Source: %s)", channel_username, channel_source_type)
     await update.message.chat.send_action("typing")
 
     client = get_client()
@@ -314,20 +348,13 @@ async def _handle_telegram_channel(update: Update, context: CallbackContext, cha
         target_feed = await asyncio.to_thread(find_feed_by_channel, client, channel_username)
 
         if target_feed:
-            logging.info(f"Channel @{channel_username} is already in subscriptions (matched channel name)")
-            feed_id = target_feed.get("id")
-            current_flags = []
-            current_merge_seconds = None
-            try:
-                # Re-fetch the feed to get the latest URL
-                updated_target_feed = await asyncio.to_thread(client.get_feed, feed_id)
-                parsed_current = parse_feed_url(updated_target_feed.get("feed_url", ""))
-                current_flags = parsed_current.get("flags") or []
-                current_merge_seconds = parsed_current.get("merge_seconds")
-                logging.info(f"Current flags for @{channel_username}: {current_flags}, merge_seconds: {current_merge_seconds}")
-            except Exception as error:
-                logging.error(f"Failed to fetch current feed details for feed {feed_id}: {error}")
-                await update.message.reply_text("Error fetching current feed status. Proceeding without status.")
+            logging.info("Channel @%s is already in subscriptions (matched channel name)", channel_username)
+            # The feed comes from the cached feed list, which every mutation made by
+            # the bot invalidates, so its URL is current: no need to re-fetch it.
+            parsed_current = parse_feed_url(target_feed.get("feed_url", ""))
+            current_flags = parsed_current.get("flags") or []
+            current_merge_seconds = parsed_current.get("merge_seconds")
+            logging.info("Current flags for @%s: %s, merge_seconds: %s", channel_username, current_flags, current_merge_seconds)
 
             reply_markup, flags_note = await build_options_view(
                 channel_username, current_flags, current_merge_seconds
@@ -430,6 +457,12 @@ async def handle_message(update: Update, context: CallbackContext):
 
     # --- State Handlers ---
     current_state = context.user_data.get('state')
+    if current_state and msg.to_dict().get("forward_from_chat"):
+        # A forward is never the answer to a regex / merge time prompt: leave the
+        # edit flow and handle it as a new channel instead of storing a bogus value.
+        logging.info("Forwarded message received in state '%s', leaving the edit flow", current_state)
+        clear_edit_state(context)
+        current_state = None
     if current_state == 'awaiting_regex':
         await _handle_awaiting_regex(update, context)
         return
@@ -439,8 +472,8 @@ async def handle_message(update: Update, context: CallbackContext):
 
     # --- Media Group Handling ---
     media_group_id = msg.media_group_id
-    if media_group_id and context.user_data.get("processed_media_group_id") == media_group_id:
-        logging.info(f"Skipping duplicate message from media group {media_group_id}")
+    if media_group_id and media_group_id in _processed_media_groups:
+        logging.info("Skipping duplicate message from media group %s", media_group_id)
         return
 
     # --- Content Parsing and Handling ---
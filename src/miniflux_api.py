@@ -6,25 +6,46 @@ in asyncio.to_thread() so the event loop is never blocked.
 
 import logging
 import time
+from collections import defaultdict
 
 import miniflux
+import requests
 from miniflux import Client, ClientError, ServerError
+from requests.adapters import HTTPAdapter
 
 from src.settings import settings
 from src.url_constructor import parse_feed_url
 
 _client: Client | None = None
 
+# Handlers run the synchronous client in worker threads (asyncio.to_thread), so
+# several requests may be in flight at once. Size the keep-alive pool for that
+# instead of opening a fresh connection for every request past the default 10.
+HTTP_POOL_SIZE = 16
+
 # The feed list barely changes between interactions, but every button press used
 # to re-fetch it. Cache it for a short TTL and invalidate on every mutation so a
 # create/update/delete is reflected immediately.
 _FEEDS_CACHE_TTL_SECONDS = 30
 _feeds_cache: tuple[float, list] | None = None
+# Lower-cased channel name -> feed, derived from the cached feed list on first
+# lookup and dropped together with it, so a channel lookup is a dict hit instead
+# of re-parsing every feed URL.
+_channel_index: dict[str, dict] | None = None
+# The set of subscribed feed URLs, derived and dropped the same way, so a
+# duplicate check is a hash lookup instead of a scan over every feed.
+_feed_urls: frozenset[str] | None = None
+
+
+# Categories are only created in the Miniflux UI, never by the bot, so a longer
+# TTL is safe: subscribing several channels in a row reuses one fetch.
+_CATEGORIES_CACHE_TTL_SECONDS = 300
+_categories_cache: tuple[float, list] | None = None
 
 
 def _get_feeds(client) -> list:
     """Return the feed list, cached for a short TTL. Only successful fetches are cached."""
-    global _feeds_cache
+    global _feeds_cache, _channel_index, _feed_urls
     now = time.monotonic()
     if _feeds_cache is not None:
         cached_at, feeds = _feeds_cache
@@ -32,13 +53,60 @@ def _get_feeds(client) -> list:
             return feeds
     feeds = client.get_feeds()   # may raise -> nothing cached
     _feeds_cache = (time.monotonic(), feeds)
+    _channel_index = None
+    _feed_urls = None
     return feeds
 
 
 def invalidate_feeds_cache() -> None:
     """Drop the cached feed list so the next read fetches fresh data."""
-    global _feeds_cache
+    global _feeds_cache, _channel_index, _feed_urls
     _feeds_cache = None
+    _channel_index = None
+    _feed_urls = None
+
+
+def invalidate_categories_cache() -> None:
+    """Drop the cached category list so the next read fetches fresh data."""
+    global _categories_cache
+    _categories_cache = None
+
+
+def _get_feed_urls(client) -> frozenset[str]:
+    """Return the set of subscribed feed URLs for the current (cached) feed list."""
+    global _feed_urls
+    feeds = _get_feeds(client)   # may drop a stale set
+    if _feed_urls is None:
+        _feed_urls = frozenset(feed["feed_url"] for feed in feeds)
+    return _feed_urls
+
+
+def _get_channel_index(client) -> dict[str, dict]:
+    """Return the channel -> feed index for the current (cached) feed list."""
+    global _channel_index
+    feeds = _get_feeds(client)   # may drop a stale index
+    if _channel_index is None:
+        index: dict[str, dict] = {}
+        for feed in feeds:
+            channel_name = parse_feed_url(feed.get("feed_url", "")).get("channel_name")
+            if channel_name:
+                # The first feed wins, as in a linear scan
+                index.setdefault(channel_name.lower(), feed)
+        _channel_index = index
+    return _channel_index
+
+
+def _build_session() -> requests.Session:
+    """Build a dedicated HTTP session with a keep-alive pool for the Miniflux client.
+
+    miniflux.Client's default session is a single object created at import time
+    and shared by every client; a dedicated one keeps our auth headers to ourselves.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def get_client() -> Client:
@@ -50,14 +118,17 @@ def get_client() -> Client:
     global _client
     if _client is None:
         if settings.miniflux_api_key:
-            logging.info(f"Initializing Miniflux client for {settings.miniflux_base_url} using API key.")
-            _client = miniflux.Client(settings.miniflux_base_url, api_key=settings.miniflux_api_key)
+            logging.info("Initializing Miniflux client for %s using API key.", settings.miniflux_base_url)
+            _client = miniflux.Client(
+                settings.miniflux_base_url, api_key=settings.miniflux_api_key, session=_build_session()
+            )
         else:
-            logging.info(f"Initializing Miniflux client for {settings.miniflux_base_url} using username/password.")
+            logging.info("Initializing Miniflux client for %s using username/password.", settings.miniflux_base_url)
             _client = miniflux.Client(
                 settings.miniflux_base_url,
                 username=settings.miniflux_username,
                 password=settings.miniflux_password,
+                session=_build_session(),
             )
         logging.info("Miniflux client initialized successfully.")
     return _client
@@ -73,24 +144,37 @@ def format_miniflux_error(error) -> str:
     return f"Status: {status_code}, Error: {error_reason}"
 
 
+def _log_api_error(action: str, error: Exception) -> None:
+    """Log a failed Miniflux call with whatever status and response the error carries."""
+    logging.error(
+        "%s. Status: %s. Error: %s. Response: %s",
+        action,
+        getattr(error, "status_code", "N/A"),
+        error,
+        getattr(error, "text", "No response content available"),
+        exc_info=True,
+    )
+
+
 def fetch_categories(client):
     """
     Fetch categories from the Miniflux API using the miniflux client.
     This function accesses the API endpoint '/categories' via the client's methods.
+    The list is cached for a few minutes; only successful fetches are cached.
     """
+    global _categories_cache
+    if _categories_cache is not None:
+        cached_at, categories = _categories_cache
+        if time.monotonic() - cached_at < _CATEGORIES_CACHE_TTL_SECONDS:
+            return categories
     try:
         logging.info("Requesting categories from Miniflux API endpoint '/categories'")
         categories = client.get_categories()
-        logging.info(f"Successfully fetched {len(categories)} categories from the API")
+        logging.info("Successfully fetched %s categories from the API", len(categories))
+        _categories_cache = (time.monotonic(), categories)
         return categories
     except Exception as error:
-        # Attempt to get more detailed error info if available
-        response_content = getattr(error, "text", "No response content available")
-        status_code = getattr(error, "status_code", "N/A")
-        logging.error(
-            f"Error fetching categories from Miniflux API endpoint '/categories'. Status: {status_code}. Error: {error}. Response: {response_content}",
-            exc_info=True
-        )
+        _log_api_error("Error fetching categories from Miniflux API endpoint '/categories'", error)
         raise
 
 
@@ -99,52 +183,70 @@ def check_feed_exists(client, feed_url):
     Check if a feed with the specified URL already exists in subscriptions.
     """
     try:
-        logging.debug(f"Checking if feed exists with URL: {feed_url}")
-        feeds = _get_feeds(client)
-        exists = any(feed["feed_url"] == feed_url for feed in feeds)
-        logging.info(f"Feed with URL {feed_url} {'exists' if exists else 'does not exist'} in subscriptions.")
+        logging.debug("Checking if feed exists with URL: %s", feed_url)
+        exists = feed_url in _get_feed_urls(client)
+        logging.info("Feed with URL %s %s in subscriptions.", feed_url, "exists" if exists else "does not exist")
         return exists
     except Exception as error:
-        status_code = getattr(error, "status_code", "N/A")
-        logging.error(
-            f"Failed to check existing feeds in Miniflux. Status: {status_code}. Error: {error}",
-            exc_info=True
-        )
+        _log_api_error("Failed to check existing feeds in Miniflux", error)
         raise
 
 
+def get_feed_by_id(client, feed_id: int) -> dict:
+    """Return one feed, served from the cached feed list when it is there.
+
+    The cache is invalidated by every mutation the bot makes, so a cached feed
+    carries its current URL; only a feed missing from it costs a round-trip.
+    """
+    for feed in _get_feeds(client):
+        if feed.get("id") == feed_id:
+            return feed
+    return client.get_feed(feed_id)
+
+
+def warm_caches(client) -> None:
+    """Fill the feed list, channel index and category caches ahead of the first interaction."""
+    _get_channel_index(client)
+    fetch_categories(client)
+
+
 def find_feed_by_channel(client, channel_name: str) -> dict | None:
     """Find the feed subscribed for a given Telegram channel.
 
-    Scans all feeds and returns the first one whose feed URL parses to a matching
-    channel name (case-insensitive), or None if the channel is not subscribed.
+    Returns the first feed whose feed URL parses to a matching channel name
+    (case-insensitive), or None if the channel is not subscribed.
     """
-    feeds = _get_feeds(client)
-    for feed in feeds:
-        feed_url = feed.get("feed_url", "")
-        parsed_data = parse_feed_url(feed_url)
-        existing_channel_name = parsed_data.get("channel_name")
-        if existing_channel_name and existing_channel_name.lower() == channel_name.lower():
-            logging.info(f"Found existing feed for channel '{channel_name}': ID={feed.get('id')}, URL={feed_url}")
-            return feed
+    feed = _get_channel_index(client).get(channel_name.lower())
+    if feed is not None:
+        logging.info("Found existing feed for channel '%s': ID=%s, URL=%s", channel_name, feed.get('id'), feed.get('feed_url', ''))
+        return feed
 
-    logging.info(f"No feed found for channel '{channel_name}'.")
+    logging.info("No feed found for channel '%s'.", channel_name)
     return None
 
 
-def update_feed_url(feed_id: int, new_url: str, client) -> tuple[bool, str | None, str | None]:
-    """Updates the URL for a specific feed."""
+def update_feed_url(
+    feed_id: int, new_url: str, client, current_url: str | None = None
+) -> tuple[bool, str | None, str | None]:
+    """Updates the URL for a specific feed.
+
+    When the caller passes the feed's current URL and it already equals new_url,
+    the API call is skipped and the update is reported as successful.
+    """
+    if current_url is not None and current_url == new_url:
+        logging.info("Feed ID %s already has URL %s, skipping the update", feed_id, new_url)
+        return True, new_url, None
     try:
         client.update_feed(feed_id, feed_url=new_url)
         invalidate_feeds_cache()
-        logging.info(f"Successfully updated feed URL for feed ID {feed_id} to: {new_url}")
+        logging.info("Successfully updated feed URL for feed ID %s to: %s", feed_id, new_url)
         return True, new_url, None
     except (ClientError, ServerError) as error:
         error_message = format_miniflux_error(error)
-        logging.error(f"Miniflux API error while updating URL for feed {feed_id}: {error_message}")
+        logging.error("Miniflux API error while updating URL for feed %s: %s", feed_id, error_message)
         return False, None, error_message
     except Exception as e:
-        logging.error(f"Unexpected error updating feed URL for feed {feed_id}: {e}", exc_info=True)
+        logging.error("Unexpected error updating feed URL for feed %s: %s", feed_id, e, exc_info=True)
         return False, None, str(e)
 
 
@@ -153,7 +255,7 @@ def delete_feed(client, feed_id: int) -> tuple[bool, str | None]:
     try:
         client.delete_feed(feed_id)
         invalidate_feeds_cache()
-        logging.info(f"Successfully deleted feed ID {feed_id}")
+        logging.info("Successfully deleted feed ID %s", feed_id)
         return True, None
     except (ClientError, ServerError) as error:
         error_message = format_miniflux_error(error)
@@ -171,6 +273,11 @@ def create_feed(client, feed_url: str, category_id: int):
     return result
 
 
+# Shared stand-in for a feed without a category (never mutated), so grouping does
+# not allocate an empty dict per feed; "or" also covers an explicit null.
+_NO_CATEGORY: dict = {}
+
+
 def get_channels_by_category(client: Client, rss_bridge_url: str | None) -> dict[str, list[dict]]:
     """
     Fetches feeds, filters for RSS Bridge channels, groups by category,
@@ -197,14 +304,16 @@ def get_channels_by_category(client: Client, rss_bridge_url: str | None) -> dict
     base_bridge_url = None
     if rss_bridge_url and "{channel}" in rss_bridge_url:
         base_bridge_url = rss_bridge_url.split('{channel}')[0]
-        logging.info(f"Filtering feeds based on RSS Bridge base URL: {base_bridge_url}")
+        logging.info("Filtering feeds based on RSS Bridge base URL: %s", base_bridge_url)
     else:
         logging.warning(
             f"rss_bridge_url is missing or invalid ('{{channel}}' placeholder not found): {rss_bridge_url}. "
             "Proceeding without base URL filtering."
         )
 
-    bridge_feeds = []
+    # Group in a single pass; each bucket is sorted on its own afterwards, so the
+    # category title is never part of a per-feed sort key.
+    grouped: defaultdict[str, list[dict]] = defaultdict(list)
     for feed in feeds:
         feed_url = feed.get("feed_url", "")
 
@@ -218,41 +327,32 @@ def get_channels_by_category(client: Client, rss_bridge_url: str | None) -> dict
 
             # A parsed channel name confirms the bridge structure
             if channel:
-                bridge_feeds.append({
+                category = feed.get("category") or _NO_CATEGORY
+                grouped[category.get("title", "Unknown")].append({
                     "id": feed.get("id"),
                     "title": feed.get("title", "Unknown"),
                     "channel": channel,
-                    "feed_url": feed_url,
                     "flags": parsed_data.get("flags") or [],
                     "excluded_text": parsed_data.get("exclude_text") or "",
                     "merge_seconds": parsed_data.get("merge_seconds"),
-                    "category_id": feed.get("category", {}).get("id"),
-                    "category_title": feed.get("category", {}).get("title", "Unknown"),
                 })
 
         except Exception as parse_error:
             logging.warning(f"Could not parse feed URL '{feed_url}': {parse_error}", exc_info=False)
             continue  # Skip this feed
 
-    if not bridge_feeds:
+    if not grouped:
         logging.info("No feeds matched the specified RSS Bridge URL pattern and structure.")
         return {}
 
-    # Sort by category title, then feed title
-    bridge_feeds.sort(key=lambda x: (x["category_title"].lower(), x["title"].lower()))
-
-    # Group by category title
-    grouped_channels: dict[str, list[dict]] = {}
-    for feed in bridge_feeds:
-        cat_title = feed["category_title"]
-        grouped_channels.setdefault(cat_title, []).append({
-            "id": feed["id"],
-            "title": feed["title"],
-            "channel": feed["channel"],
-            "flags": feed["flags"],
-            "excluded_text": feed["excluded_text"],
-            "merge_seconds": feed["merge_seconds"],
-        })
-
-    logging.info(f"Grouped {len(bridge_feeds)} bridge channels into {len(grouped_channels)} categories.")
+    # Categories by title, then feeds by title within each, case-insensitively
+    for bucket in grouped.values():
+        bucket.sort(key=lambda item: item["title"].lower())
+    grouped_channels = dict(sorted(grouped.items(), key=lambda entry: entry[0].lower()))
+
+    logging.info(
+        "Grouped %s bridge channels into %s categories.",
+        sum(len(bucket) for bucket in grouped_channels.values()),
+        len(grouped_channels),
+    )
     return grouped_channels
@@ -1,7 +1,8 @@
 """Parsing and building of RSS-Bridge feed URLs."""
 
+import functools
 import urllib.parse
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.url_utils import extract_channel_from_feed_url
 
@@ -10,6 +11,9 @@ PARAM_EXCLUDE_FLAGS = "exclude_flags"
 PARAM_EXCLUDE_TEXT = "exclude_text"
 PARAM_MERGE_SECONDS = "merge_seconds"
 
+# Distinct feed URLs whose parsed query is kept in memory (one per subscription).
+PARSE_CACHE_SIZE = 1024
+
 
 def parse_feed_url(feed_url: str) -> Dict[str, Optional[str | List[str] | int]]:
     """
@@ -26,40 +30,53 @@ def parse_feed_url(feed_url: str) -> Dict[str, Optional[str | List[str] | int]]:
         - 'exclude_text': The value of the 'exclude_text' parameter, or None.
         - 'merge_seconds': The integer value of 'merge_seconds', or None.
     """
-    parsed_url = urllib.parse.urlparse(feed_url)
-    query_params = urllib.parse.parse_qs(parsed_url.query, keep_blank_values=True)
+    base_url, flags, exclude_text, merge_seconds = _parse_query_components(feed_url)
+
+    return {
+        "base_url": base_url,
+        # Resolved on every call: it depends on the configured bridge template.
+        "channel_name": extract_channel_from_feed_url(feed_url),
+        # A fresh list per call, so callers may mutate it without touching the cache.
+        "flags": list(flags) if flags is not None else None,
+        "exclude_text": exclude_text,
+        "merge_seconds": merge_seconds,
+    }
 
-    base_url = urllib.parse.urlunparse((
-        parsed_url.scheme,
-        parsed_url.netloc,
-        parsed_url.path,
-        "", "", ""  # Remove params, query, fragment for base
-    ))
 
-    channel_name = extract_channel_from_feed_url(feed_url)
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_query_components(
+    feed_url: str,
+) -> Tuple[str, Optional[Tuple[str, ...]], Optional[str], Optional[int]]:
+    """Split a feed URL into (base_url, flags, exclude_text, merge_seconds).
+
+    Memoized per URL: the same feed list is parsed on every interaction, so the
+    URL is split and its query decoded once per distinct URL. Only immutable
+    values are cached.
+    """
+    parsed_url = urllib.parse.urlsplit(feed_url)
+    # One flat {name: value} mapping; the first occurrence of a repeated name wins.
+    query_params: Dict[str, str] = {}
+    for name, value in urllib.parse.parse_qsl(parsed_url.query, keep_blank_values=True):
+        query_params.setdefault(name, value)
+
+    # Drop the query and fragment for the base
+    base_url = urllib.parse.urlunsplit((parsed_url.scheme, parsed_url.netloc, parsed_url.path, "", ""))
 
     flags = None
-    if PARAM_EXCLUDE_FLAGS in query_params:
-        flags_str = query_params[PARAM_EXCLUDE_FLAGS][0]
-        if flags_str:  # Avoid creating [''] for an empty parameter
-            flags = flags_str.split(',')
+    flags_str = query_params.get(PARAM_EXCLUDE_FLAGS)
+    if flags_str:  # Avoid creating [''] for an empty parameter
+        flags = tuple(flags_str.split(','))
 
-    exclude_text = query_params.get(PARAM_EXCLUDE_TEXT, [None])[0]
+    exclude_text = query_params.get(PARAM_EXCLUDE_TEXT)
 
     merge_seconds = None
     if PARAM_MERGE_SECONDS in query_params:
         try:
-            merge_seconds = int(query_params[PARAM_MERGE_SECONDS][0])
-        except (ValueError, IndexError):
+            merge_seconds = int(query_params[PARAM_MERGE_SECONDS])
+        except ValueError:
             merge_seconds = None  # Treat invalid values as None
 
-    return {
-        "base_url": base_url,
-        "channel_name": channel_name,
-        "flags": flags,
-        "exclude_text": exclude_text,
-        "merge_seconds": merge_seconds,
-    }
+    return base_url, flags, exclude_text, merge_seconds
 
 
 def build_feed_url(
@@ -93,20 +110,17 @@ def build_feed_url(
 
     # Add exclude_text only if it's a non-empty string
     if exclude_text:
-        # URL-encode the value using quote (handles spaces as %20, etc.)
+        # URL-encode the value using quote (handles spaces as %20, etc.). The
+        # encoding must stay exactly this one: existing subscriptions were built
+        # with it, and an unchanged feed has to rebuild to the very same URL.
         encoded_text = urllib.parse.quote(exclude_text)
         query_parts.append(f"{PARAM_EXCLUDE_TEXT}={encoded_text}")
 
     if merge_seconds is not None and merge_seconds > 0:
         query_parts.append(f"{PARAM_MERGE_SECONDS}={str(merge_seconds)}")
 
-    final_url = base_url
-
-    if query_parts:
-        query_string = "&".join(query_parts)
-
-        parsed_base = urllib.parse.urlparse(final_url)
-        separator = "&" if parsed_base.query else "?"
-        final_url += separator + query_string
+    if not query_parts:
+        return base_url
 
-    return final_url
+    separator = "&" if urllib.parse.urlsplit(base_url).query else "?"
+    return base_url + separator + "&".join(query_parts)
@@ -1,5 +1,6 @@
 """URL helpers: Telegram link parsing, RSS discovery and feed-URL introspection."""
 
+import functools
 import logging
 import re
 import urllib.parse
@@ -32,9 +33,15 @@ TELEGRAM_LINK_RE = re.compile(
 )
 
 
+# Distinct (bridge prefix, feed URL) pairs whose channel is kept in memory.
+CHANNEL_CACHE_SIZE = 1024
+
+
 def parse_telegram_link(text: str) -> str | None:
     """Find a t.me link inside the text and return the channel username or id."""
-    if not text:
+    # Most messages hold no link at all; a substring check is far cheaper than a
+    # regex search. The host is matched case-sensitively, so this is exact.
+    if not text or "t.me/" not in text:
         return None
 
     match = TELEGRAM_LINK_RE.search(text)
@@ -43,23 +50,44 @@ def parse_telegram_link(text: str) -> str | None:
         logging.info(f"Parsed Telegram link: channel='{channel_name}'")
         return channel_name
 
-    logging.debug(f"No valid t.me link found in text: '{text}'")
+    logging.debug("No valid t.me link found in text: '%s'", text)
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _bridge_base(rss_bridge_url: str) -> str:
+    """The part of the bridge template before the {channel} placeholder.
+
+    Keyed by the template itself, so it is split once per template rather than
+    once per feed, and a changed template simply gets its own entry.
+    """
+    return rss_bridge_url.split("{channel}")[0]
+
+
 def extract_channel_from_feed_url(feed_url):
     """
     Extract the channel username or id from a feed URL, using the configured
     RSS bridge URL template. The template is read at call time on purpose: an
     import-time snapshot goes stale and cannot be patched.
     """
-    rss_bridge_url = settings.rss_bridge_url
+    if not feed_url:
+        return None
+    return _extract_channel(_bridge_base(settings.rss_bridge_url), feed_url)
+
 
-    if not feed_url or not feed_url.startswith(rss_bridge_url.split("{channel}")[0]):
-        logging.debug(f"Feed URL '{feed_url}' does not match the configured RSS_BRIDGE_URL pattern.")
+@functools.lru_cache(maxsize=CHANNEL_CACHE_SIZE)
+def _extract_channel(base_part: str, feed_url: str) -> str | None:
+    """The channel in feed_url after the bridge prefix base_part, memoized.
+
+    The same feed URLs are resolved on every /list and channel lookup. Keying by
+    the bridge prefix as well keeps a changed template from serving stale results.
+    """
+    # One prefix comparison rejects a non-bridge feed; the debug message is
+    # formatted lazily, only when it is emitted.
+    if not feed_url.startswith(base_part):
+        logging.debug("Feed URL '%s' does not match the configured RSS_BRIDGE_URL pattern.", feed_url)
         return None
 
-    base_part = rss_bridge_url.split("{channel}")[0]
     remaining_url_part = feed_url[len(base_part):]
     # The channel name runs until the next slash or the end of the string.
     channel = remaining_url_part.split("/")[0] if "/" in remaining_url_part else remaining_url_part
@@ -69,7 +97,7 @@ def extract_channel_from_feed_url(feed_url):
     if channel:
         # Decode URL-encoded characters (e.g. %40 for @).
         decoded_channel = urllib.parse.unquote(channel)
-        logging.debug(f"Extracted channel '{decoded_channel}' from feed URL '{feed_url}'.")
+        logging.debug("Extracted channel '%s' from feed URL '%s'.", decoded_channel, feed_url)
         return decoded_channel
 
     logging.warning(f"Could not extract channel name from feed URL '{feed_url}' despite matching base pattern.")
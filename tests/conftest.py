@@ -22,7 +22,10 @@ from unittest.mock import AsyncMock, MagicMock, patch  # noqa: E402
 import pytest  # noqa: E402
 
 import src.handlers.keyboards as keyboards  # noqa: E402
+import src.handlers.messages as messages  # noqa: E402
 import src.miniflux_api as miniflux_api  # noqa: E402
+import src.url_constructor as url_constructor  # noqa: E402
+import src.url_utils as url_utils  # noqa: E402
 from src.settings import settings  # noqa: E402
 
 # The flags the fake RSS bridge reports in tests.
@@ -52,24 +55,23 @@ def mock_miniflux_client():
 
 
 @pytest.fixture(autouse=True)
-def patch_get_client(mock_miniflux_client):
+def patch_get_client(monkeypatch, mock_miniflux_client):
     """Hand the mock client to every module that resolves it via get_client().
 
     The client is no longer a module global: handlers call get_client() at call
-    time, so it must be patched in each module where the name is used.
+    time, so it must be patched in each module where the name is used. Nothing
+    asserts on these calls, so a plain function swap is enough (no mock needed).
     """
     targets = [
         "src.miniflux_api.get_client",
+        "src.bot.get_client",
         "src.handlers.callbacks.get_client",
         "src.handlers.commands.get_client",
         "src.handlers.messages.get_client",
     ]
-    patchers = [patch(target, return_value=mock_miniflux_client) for target in targets]
-    for patcher in patchers:
-        patcher.start()
-    yield mock_miniflux_client
-    for patcher in patchers:
-        patcher.stop()
+    for target in targets:
+        monkeypatch.setattr(target, lambda: mock_miniflux_client)
+    return mock_miniflux_client
 
 
 @pytest.fixture(autouse=True)
@@ -90,10 +92,41 @@ def patch_available_flags():
 
 @pytest.fixture(autouse=True)
 def reset_feeds_cache():
-    """Reset the module-level feed-list cache around every test to keep them isolated."""
-    miniflux_api._feeds_cache = None
+    """Reset the module-level feed and category caches around every test to keep them isolated."""
+    miniflux_api.invalidate_feeds_cache()
+    miniflux_api.invalidate_categories_cache()
+    keyboards._category_keyboard_cache = None
     yield
-    miniflux_api._feeds_cache = None
+    miniflux_api.invalidate_feeds_cache()
+    miniflux_api.invalidate_categories_cache()
+    keyboards._category_keyboard_cache = None
+
+
+# Module-level memoization caches (functools.lru_cache), cleared like the caches above.
+MEMOIZED_FUNCTIONS = [
+    url_utils._bridge_base,
+    url_utils._extract_channel,
+    url_constructor._parse_query_components,
+    keyboards._options_markup,
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_memoized_functions():
+    """Clear the lru_caches around every test so no result leaks between tests."""
+    for function in MEMOIZED_FUNCTIONS:
+        function.cache_clear()
+    yield
+    for function in MEMOIZED_FUNCTIONS:
+        function.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_media_groups():
+    """Forget the module-level processed media groups around every test."""
+    messages._processed_media_groups.clear()
+    yield
+    messages._processed_media_groups.clear()
 
 
 @pytest.fixture
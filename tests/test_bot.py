@@ -1,10 +1,21 @@
 """Tests for src/bot.py: post_init, error_handler and build_application."""
 
+import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from telegram import Update
+from telegram import BotCommand, Chat, Message, MessageEntity, Update, User
+from telegram.ext import CommandHandler, MessageHandler
 
-from src.bot import ERROR_MESSAGE, build_application, error_handler, post_init
+from src.bot import (
+    ALLOWED_UPDATES,
+    ERROR_MESSAGE,
+    POLLING_TIMEOUT_SECONDS,
+    build_application,
+    error_handler,
+    post_init,
+    run,
+)
+from src.miniflux_api import fetch_categories, find_feed_by_channel
 
 # --- post_init --------------------------------------------------------------
 
@@ -16,9 +27,12 @@ async def test_post_init_sets_commands():
     await post_init(application)
 
     application.bot.set_my_commands.assert_called_once()
-    commands = application.bot.set_my_commands.call_args[0][0]
-    assert ("start", "Start working with the bot") in commands
-    assert ("list", "Show list of subscribed channels") in commands
+    registered = application.bot.set_my_commands.call_args[0][0]
+    assert list(registered) == [
+        BotCommand("start", "Start working with the bot"),
+        BotCommand("list", "Show list of subscribed channels"),
+        BotCommand("cancel", "Cancel the current edit"),
+    ]
 
 
 async def test_post_init_swallows_errors():
@@ -34,6 +48,34 @@ async def test_post_init_swallows_errors():
     assert "Failed to set up bot commands" in mock_log.call_args[0][0]
 
 
+async def test_post_init_warms_miniflux_caches(mock_miniflux_client):
+    """The feed list and categories are fetched once at startup and then served from memory."""
+    application = MagicMock()
+    application.bot = AsyncMock()
+    mock_miniflux_client.get_feeds.return_value = [{"id": 1, "feed_url": "http://b/rss/chan"}]
+    mock_miniflux_client.get_categories.return_value = [{"id": 1, "title": "News"}]
+
+    await post_init(application)
+    find_feed_by_channel(mock_miniflux_client, "anything")
+    fetch_categories(mock_miniflux_client)
+
+    mock_miniflux_client.get_feeds.assert_called_once()
+    mock_miniflux_client.get_categories.assert_called_once()
+
+
+async def test_post_init_survives_miniflux_outage(mock_miniflux_client):
+    """Miniflux being down at startup is logged; the bot still starts."""
+    application = MagicMock()
+    application.bot = AsyncMock()
+    mock_miniflux_client.get_feeds.side_effect = Exception("connection refused")
+
+    with patch("src.bot.logging.warning") as mock_log:
+        await post_init(application)  # must not raise
+
+    application.bot.set_my_commands.assert_called_once()
+    assert "Failed to warm up Miniflux caches" in mock_log.call_args[0][0]
+
+
 # --- error_handler ----------------------------------------------------------
 
 
@@ -95,5 +137,49 @@ def test_build_application_wires_everything():
         result = build_application()
 
     assert result is mock_app
+    # Updates stay sequential: the caches and the edit state are not concurrency-safe
+    mock_builder.return_value.token.return_value.post_init.return_value.concurrent_updates.assert_not_called()
     assert mock_app.add_handler.call_count >= 4
     mock_app.add_error_handler.assert_called_once()
+
+
+def _command_update(chat_type: str) -> Update:
+    """A real /list Update sent from a chat of the given type."""
+    message = Message(
+        message_id=1,
+        date=datetime.datetime.now(datetime.timezone.utc),
+        chat=Chat(id=1, type=chat_type),
+        from_user=User(id=1, first_name="admin", is_bot=False, username="test_admin"),
+        text="/list",
+        entities=[MessageEntity(type=MessageEntity.BOT_COMMAND, offset=0, length=5)],
+    )
+    return Update(update_id=1, message=message)
+
+
+def test_build_application_ignores_non_private_chats():
+    """Commands and messages are only dispatched for private chats."""
+    application = build_application()
+    filtered = [
+        handler for handler in application.handlers[0]
+        if isinstance(handler, (CommandHandler, MessageHandler))
+    ]
+
+    assert len(filtered) == 4
+    for handler in filtered:
+        assert handler.filters.check_update(_command_update(Chat.PRIVATE))
+        assert not handler.filters.check_update(_command_update(Chat.GROUP))
+
+
+# --- run --------------------------------------------------------------------
+
+
+def test_run_long_polls_only_handled_update_types():
+    with patch("src.bot.build_application") as mock_build:
+        run()
+
+    mock_build.return_value.run_polling.assert_called_once_with(
+        timeout=POLLING_TIMEOUT_SECONDS,
+        drop_pending_updates=True,
+        allowed_updates=ALLOWED_UPDATES,
+    )
+    assert set(ALLOWED_UPDATES) == {Update.MESSAGE, Update.CALLBACK_QUERY}
@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 import pytest
 from miniflux import ClientError
+from telegram.error import BadRequest
 
 from src.handlers.callbacks import button_callback
 
@@ -42,12 +43,37 @@ async def test_button_callback_category_selection_api_error(mock_update, mock_co
     await button_callback(mock_update, mock_context)
 
     mock_update.callback_query.answer.assert_called_once()
-    mock_update.callback_query.edit_message_text.assert_called_once()
+    # The progress message first, then the error
+    assert mock_update.callback_query.edit_message_text.call_count == 2
     message = mock_update.callback_query.edit_message_text.call_args[0][0]
     assert "Failed to subscribe" in message
     assert "API Error" in message
-    # The URL survives the failure so the user can retry without re-sending the link
+    # The URL survives the failure and the categories come back, so the user can
+    # retry with one tap instead of re-sending the link
     assert mock_context.user_data["direct_rss_url"] == "https://example.com/feed.xml"
+    reply_markup = mock_update.callback_query.edit_message_text.call_args.kwargs["reply_markup"]
+    buttons = [button for row in reply_markup.inline_keyboard for button in row]
+    assert [button.callback_data for button in buttons] == ["cat_123"]
+    assert buttons[0].text == "Test Category"
+
+
+async def test_button_callback_category_selection_progress_edit_error(mock_update, mock_context, mock_miniflux_client):
+    """A failing progress edit is reported like any other error, not raised out of the handler."""
+    mock_update.callback_query.data = "cat_123"
+    mock_context.user_data = {
+        "channel_title": "test_channel",
+        "categories": {123: "Test Category"},
+    }
+    mock_update.callback_query.edit_message_text.side_effect = [BadRequest("Message to edit not found"), None]
+
+    await button_callback(mock_update, mock_context)
+
+    mock_miniflux_client.create_feed.assert_not_called()
+    assert mock_update.callback_query.edit_message_text.call_count == 2
+    call = mock_update.callback_query.edit_message_text.call_args
+    assert "Unexpected error while subscribing" in call[0][0]
+    assert call.kwargs["reply_markup"] is not None
+    assert mock_context.user_data["channel_title"] == "test_channel"
 
 
 async def test_button_callback_rss_link_check_feed_error(mock_update, mock_context):
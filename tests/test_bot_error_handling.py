@@ -84,53 +84,35 @@ async def test_handle_message_parse_exception(mock_update, mock_context):
     assert "Failed to parse message content" in message
 
 
-async def test_handle_message_telegram_channel_exception(mock_update, mock_context):
+@pytest.mark.parametrize(
+    "parsed,handler,expected",
+    [
+        (
+            ParsedMessage(channel_username="channel_username", channel_source_type="forward"),
+            "_handle_telegram_channel",
+            "Error processing telegram channel @channel_username: boom",
+        ),
+        (
+            ParsedMessage(direct_rss_url="https://example.com/feed.xml"),
+            "_handle_direct_rss",
+            "Error processing RSS feed: boom",
+        ),
+        (
+            ParsedMessage(html_rss_links=[{"title": "Test", "href": "https://example.com/feed.xml"}]),
+            "_handle_html_rss_links",
+            "Error processing website with RSS links: boom",
+        ),
+    ],
+    ids=["telegram_channel", "direct_rss", "html_rss_links"],
+)
+async def test_handle_message_branch_exception(mock_update, mock_context, parsed, handler, expected):
+    """A failure inside any routing branch is answered once, naming what was being processed."""
     with patch(
-        "src.handlers.messages._parse_message_content",
-        new=AsyncMock(return_value=ParsedMessage(channel_username="channel_username", channel_source_type="forward")),
-    ), patch(
-        "src.handlers.messages._handle_telegram_channel",
-        new=AsyncMock(side_effect=Exception("Failed to handle telegram channel")),
-    ):
-        await handle_message(mock_update, mock_context)
-
-    mock_update.message.reply_text.assert_called_once()
-    message = mock_update.message.reply_text.call_args[0][0].lower()
-    assert "error" in message
-    assert "channel" in message
-
-
-async def test_handle_message_direct_rss_exception(mock_update, mock_context):
-    with patch(
-        "src.handlers.messages._parse_message_content",
-        new=AsyncMock(return_value=ParsedMessage(direct_rss_url="https://example.com/feed.xml")),
-    ), patch(
-        "src.handlers.messages._handle_direct_rss",
-        new=AsyncMock(side_effect=Exception("Failed to handle direct RSS")),
-    ):
+        "src.handlers.messages._parse_message_content", new=AsyncMock(return_value=parsed)
+    ), patch(f"src.handlers.messages.{handler}", new=AsyncMock(side_effect=Exception("boom"))):
         await handle_message(mock_update, mock_context)
 
-    mock_update.message.reply_text.assert_called_once()
-    message = mock_update.message.reply_text.call_args[0][0]
-    assert "Error processing RSS feed" in message
-
-
-async def test_handle_message_html_rss_exception(mock_update, mock_context):
-    links = [{"title": "Test", "href": "https://example.com/feed.xml"}]
-
-    with patch(
-        "src.handlers.messages._parse_message_content",
-        new=AsyncMock(return_value=ParsedMessage(html_rss_links=links)),
-    ), patch(
-        "src.handlers.messages._handle_html_rss_links",
-        new=AsyncMock(side_effect=Exception("Failed to handle HTML RSS links")),
-    ):
-        await handle_message(mock_update, mock_context)
-
-    mock_update.message.reply_text.assert_called_once()
-    assert "Error processing website with RSS links" in (
-        mock_update.message.reply_text.call_args[0][0]
-    )
+    mock_update.message.reply_text.assert_called_once_with(expected)
 
 
 async def test_handle_message_malicious_url(mock_update, mock_context):
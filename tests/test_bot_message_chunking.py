@@ -14,20 +14,20 @@ def use_admin_settings(admin_settings):
 
 async def test_message_chunking_for_long_list(mock_update, mock_context):
     """A category too large for one message is split across several."""
+    title_padding = "x" * 200
+    pattern_padding = "y" * 100
+    flags = ["some_flag", "another_flag", "third_flag", "fourth_flag"]
+    # The first 20 feeds carry flags and feeds 30-49 a regex, so lines vary in length
     many_feeds = [
         {
-            "id": i,
-            "title": f"Feed{i}_" + "x" * 200,
-            "flags": [],
-            "excluded_text": None,
+            "id": i + 1,
+            "title": f"Feed{i + 1}_{title_padding}",
+            "flags": flags if i < 20 else [],
+            "excluded_text": f"excluded_pattern_{i}_{pattern_padding}" if 30 <= i < 50 else None,
             "merge_seconds": None,
         }
-        for i in range(1, 100)
+        for i in range(99)
     ]
-    for i in range(20):
-        many_feeds[i]["flags"] = ["some_flag", "another_flag", "third_flag", "fourth_flag"]
-    for i in range(30, 50):
-        many_feeds[i]["excluded_text"] = f"excluded_pattern_{i}_" + "y" * 100
 
     with patch(
         "src.handlers.commands.get_channels_by_category",
@@ -48,8 +48,8 @@ async def test_message_chunking_for_long_list(mock_update, mock_context):
     last_chunk = mock_update.message.reply_text.call_args_list[-1][0][0]
     assert "(continued)" in last_chunk
 
-    for call in mock_update.message.reply_text.call_args_list:
-        assert len(call[0][0]) <= MAX_MESSAGE_LENGTH
+    longest = max(len(call[0][0]) for call in mock_update.message.reply_text.call_args_list)
+    assert longest <= MAX_MESSAGE_LENGTH, f"A message of {longest} characters exceeds the limit"
 
 
 async def test_no_chunking_for_short_list(mock_update, mock_context):
@@ -94,3 +94,22 @@ async def test_chunk_never_holds_only_a_continuation_header(mock_update, mock_co
         text = call[0][0]
         assert text.strip() not in ("📁 Cat (continued)", "📁 Cat")
         assert len(text) <= MAX_MESSAGE_LENGTH
+
+
+async def test_category_title_is_rendered_verbatim(mock_update, mock_context):
+    """Titles with Markdown characters appear unescaped in both header variants."""
+    title = "News_2024 (tech). #1!"
+    feeds = [
+        {"id": i, "title": "f" * (MAX_MESSAGE_LENGTH // 2), "flags": [], "excluded_text": None,
+         "merge_seconds": None}
+        for i in range(3)
+    ]
+
+    with patch("src.handlers.commands.get_channels_by_category", return_value={title: feeds}):
+        await list_channels(mock_update, mock_context)
+
+    texts = [call[0][0] for call in mock_update.message.reply_text.call_args_list[1:]]
+    assert texts[0].startswith(f"📁 {title}\n")
+    assert texts[-1].startswith(f"📁 {title} (continued)\n")
+    for call in mock_update.message.reply_text.call_args_list:
+        assert "parse_mode" not in call[1]
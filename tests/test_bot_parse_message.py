@@ -8,6 +8,12 @@ from src.handlers.messages import ParsedMessage, _parse_message_content, handle_
 from src.settings import settings
 
 
+def _send_text(update, text):
+    """Make the update carry a plain text message (the parser reads both fields)."""
+    update.message.text = text
+    update.message.to_dict.return_value = {"text": text}
+
+
 @pytest.fixture(autouse=True)
 def use_admin_settings(admin_settings):
     return admin_settings
@@ -15,8 +21,7 @@ def use_admin_settings(admin_settings):
 
 async def test_parse_message_content_invalid_url(mock_update, mock_context):
     """Text that is neither a link nor a URL is not recognized as anything."""
-    mock_update.message.text = "invalid url without http"
-    mock_update.message.to_dict.return_value = {"text": "invalid url without http"}
+    _send_text(mock_update, "invalid url without http")
 
     result = await _parse_message_content(mock_update, mock_context)
 
@@ -27,8 +32,7 @@ async def test_parse_message_content_invalid_url(mock_update, mock_context):
 
 async def test_parse_message_content_telegram_username(mock_update, mock_context):
     """A bare @username is treated as a channel."""
-    mock_update.message.text = "@test_channel"
-    mock_update.message.to_dict.return_value = {"text": "@test_channel"}
+    _send_text(mock_update, "@test_channel")
 
     result = await _parse_message_content(mock_update, mock_context)
 
@@ -40,8 +44,7 @@ async def test_parse_message_content_telegram_username(mock_update, mock_context
 
 async def test_parse_message_content_tg_link(mock_update, mock_context):
     """A t.me link is resolved to its channel."""
-    mock_update.message.text = "https://t.me/test_channel"
-    mock_update.message.to_dict.return_value = {"text": "https://t.me/test_channel"}
+    _send_text(mock_update, "https://t.me/test_channel")
 
     result = await _parse_message_content(mock_update, mock_context)
 
@@ -111,8 +114,7 @@ async def test_parse_message_content_channel_without_username_accepted(
 
 async def test_parse_message_content_rss_url_error(mock_update, mock_context):
     """An error inside the RSS check propagates to the caller."""
-    mock_update.message.text = "https://example.com/feed"
-    mock_update.message.to_dict.return_value = {"text": "https://example.com/feed"}
+    _send_text(mock_update, "https://example.com/feed")
 
     with patch("src.handlers.messages.is_valid_rss_url", side_effect=Exception("Test RSS validation error")):
         with pytest.raises(Exception, match="Test RSS validation error"):
@@ -121,8 +123,7 @@ async def test_parse_message_content_rss_url_error(mock_update, mock_context):
 
 async def test_handle_message_with_rss_detection_error(mock_update, mock_context):
     """handle_message catches a parser failure and tells the user about it."""
-    mock_update.message.text = "https://example.com/some-page"
-    mock_update.message.to_dict.return_value = {"text": "https://example.com/some-page"}
+    _send_text(mock_update, "https://example.com/some-page")
 
     with patch("src.handlers.messages.is_valid_rss_url", side_effect=Exception("Test error detecting RSS")):
         await handle_message(mock_update, mock_context)
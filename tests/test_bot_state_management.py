@@ -191,6 +191,7 @@ async def test_complex_state_sequence(mock_update, mock_context, mock_miniflux_c
 
     # 4. Send the regex
     mock_update.message.text = "spam|ads"
+    mock_update.message.to_dict.return_value = {"text": mock_update.message.text}
     mock_miniflux_client.get_feed.return_value = {"feed_url": feed_url_for("test_channel")}
     with patch("src.handlers.messages.update_feed_url", return_value=(True, "url", None)):
         await handle_message(mock_update, mock_context)
@@ -6,7 +6,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from miniflux import ClientError
 
-from src.handlers.callbacks import _handle_flag_toggle, button_callback
+import src.handlers.messages as messages
+from src.handlers.callbacks import SUBSCRIBING_MESSAGE, _handle_flag_toggle, button_callback
 from src.handlers.commands import cancel, list_channels, start
 from src.handlers.messages import (
     _handle_awaiting_merge_time,
@@ -145,7 +146,6 @@ async def test_handle_message_forward_existing_channel(mock_update, mock_context
     }
     existing_feed = {"id": 55, "feed_url": feed_url_for("test_channel", "?exclude_flags=fwd")}
     mock_miniflux_client.get_feeds.return_value = [existing_feed]
-    mock_miniflux_client.get_feed.return_value = existing_feed
 
     await handle_message(mock_update, mock_context)
 
@@ -153,6 +153,35 @@ async def test_handle_message_forward_existing_channel(mock_update, mock_context
     text, kwargs = mock_update.message.reply_text.call_args
     assert "already in subscriptions" in text[0]
     assert kwargs["reply_markup"] is not None
+    # The flags come from the (cached) feed list: no extra per-feed round-trip
+    mock_miniflux_client.get_feed.assert_not_called()
+    labels = [btn.text for row in kwargs["reply_markup"].inline_keyboard for btn in row]
+    assert 'Remove "fwd"' in " ".join(labels)
+
+
+@pytest.mark.parametrize("state", ["awaiting_regex", "awaiting_merge_time"])
+async def test_handle_message_forward_leaves_edit_flow(mock_update, mock_context, mock_miniflux_client, state):
+    """A forward sent mid-edit is handled as a channel, not consumed as the edit value."""
+    mock_context.user_data = {
+        "state": state,
+        "editing_regex_for_channel": "other",
+        "editing_merge_time_for_channel": "other",
+        "editing_feed_id": 9,
+    }
+    mock_update.message.to_dict.return_value = {
+        "forward_from_chat": {"id": 1, "title": "T", "username": "test_channel", "type": "channel"}
+    }
+    mock_miniflux_client.get_feeds.return_value = []
+
+    with patch("src.handlers.messages.fetch_categories", return_value=[{"id": 1, "title": "News"}]), \
+         patch("src.handlers.messages.update_feed_url") as mock_update_api:
+        await handle_message(mock_update, mock_context)
+
+    mock_update_api.assert_not_called()
+    assert "state" not in mock_context.user_data
+    assert "editing_feed_id" not in mock_context.user_data
+    assert mock_context.user_data["channel_title"] == "test_channel"
+    assert "category" in mock_update.message.reply_text.call_args[0][0].lower()
 
 
 # --- handle_message: RSS URLs -----------------------------------------------
@@ -321,6 +350,31 @@ async def test_list_channels_api_error(mock_update, mock_context):
     assert str(api_error) in error_message
 
 
+async def test_list_channels_sends_categories_in_order(mock_update, mock_context, monkeypatch):
+    """Categories go out one by one in listing order; a split category stays contiguous."""
+    monkeypatch.setattr("src.handlers.commands.MAX_MESSAGE_LENGTH", 60)
+    long_title = "t" * 30
+    channel_data = {
+        f"Cat{i}": [
+            {"title": f"{long_title}{j}", "flags": [], "excluded_text": None, "merge_seconds": None}
+            for j in range(3)
+        ]
+        for i in range(3)
+    }
+
+    with patch("src.handlers.commands.get_channels_by_category", return_value=channel_data):
+        await list_channels(mock_update, mock_context)
+
+    texts = [call[0][0] for call in mock_update.message.reply_text.call_args_list]
+    assert texts[0] == "Subscribed channels by category:"
+    headers = [text.split("\n", 1)[0] for text in texts[1:]]
+    assert headers == [
+        header
+        for i in range(3)
+        for header in (f"📁 Cat{i}", f"📁 Cat{i} (continued)", f"📁 Cat{i} (continued)")
+    ]
+
+
 # --- Interactive /list: manage buttons --------------------------------------
 
 
@@ -388,7 +442,7 @@ async def test_handle_flag_toggle_add(mock_query, mock_context, mock_miniflux_cl
         await _handle_flag_toggle(mock_query, mock_context, "add", flag, channel_name)
 
     expected_url = feed_url_for(channel_name, f"?exclude_flags={flag}")
-    mock_update_api.assert_called_once_with(feed_id, expected_url, mock_miniflux_client)
+    mock_update_api.assert_called_once_with(feed_id, expected_url, mock_miniflux_client, original_url)
 
     mock_query.edit_message_text.assert_called_once()
     text = mock_query.edit_message_text.call_args[0][0]
@@ -408,7 +462,7 @@ async def test_handle_flag_toggle_remove(mock_query, mock_context, mock_miniflux
     with patch("src.handlers.callbacks.update_feed_url", return_value=(True, "url", None)) as mock_update_api:
         await _handle_flag_toggle(mock_query, mock_context, "remove", flag, channel_name)
 
-    mock_update_api.assert_called_once_with(feed_id, feed_url_for(channel_name), mock_miniflux_client)
+    mock_update_api.assert_called_once_with(feed_id, feed_url_for(channel_name), mock_miniflux_client, original_url)
 
     mock_query.edit_message_text.assert_called_once()
     text = mock_query.edit_message_text.call_args[0][0]
@@ -568,19 +622,16 @@ async def test_handle_message_awaiting_regex_update(mock_update, mock_context, m
         "editing_feed_id": feed_id,
     }
     mock_update.message.text = new_regex
-    mock_miniflux_client.get_feed.side_effect = [
-        {"id": feed_id, "feed_url": original_url},
-        {"id": feed_id, "feed_url": expected_new_url},
-    ]
+    mock_miniflux_client.get_feed.return_value = {"id": feed_id, "feed_url": original_url}
 
     with patch(
         "src.handlers.messages.update_feed_url", return_value=(True, expected_new_url, None)
     ) as mock_update_api:
         await handle_message(mock_update, mock_context)
 
-    # Once to read the current URL, once to rebuild the keyboard afterwards
-    assert mock_miniflux_client.get_feed.call_count == 2
-    mock_update_api.assert_called_once_with(feed_id, expected_new_url, mock_miniflux_client)
+    # Only to read the current URL: the keyboard is rebuilt from the URL just written
+    assert mock_miniflux_client.get_feed.call_count == 1
+    mock_update_api.assert_called_once_with(feed_id, expected_new_url, mock_miniflux_client, original_url)
 
     assert mock_update.message.reply_text.call_count == 2
     confirmation = mock_update.message.reply_text.call_args_list[0][0][0]
@@ -591,6 +642,25 @@ async def test_handle_message_awaiting_regex_update(mock_update, mock_context, m
     assert "state" not in mock_context.user_data
 
 
+async def test_handle_message_awaiting_regex_echoed_verbatim(mock_update, mock_context, mock_miniflux_client):
+    """The confirmation is plain text: a regex full of Markdown characters is shown unescaped."""
+    new_regex = r"a_b*[c](d)~`>#+-=|{}.!"
+    mock_context.user_data = {
+        "state": "awaiting_regex",
+        "editing_regex_for_channel": "chan",
+        "editing_feed_id": 7,
+    }
+    mock_update.message.text = new_regex
+    mock_miniflux_client.get_feed.return_value = {"id": 7, "feed_url": feed_url_for("chan")}
+
+    with patch("src.handlers.messages.update_feed_url", return_value=(True, feed_url_for("chan"), None)):
+        await handle_message(mock_update, mock_context)
+
+    args, kwargs = mock_update.message.reply_text.call_args_list[0]
+    assert args[0] == f"Regex for channel @chan updated to: {new_regex}"
+    assert "parse_mode" not in kwargs
+
+
 async def test_handle_message_awaiting_regex_remove(mock_update, mock_context, mock_miniflux_client):
     """Sending '-' removes the regex but keeps the other feed parameters."""
     channel_name = "channel_to_clear_regex"
@@ -604,10 +674,7 @@ async def test_handle_message_awaiting_regex_remove(mock_update, mock_context, m
         "editing_feed_id": feed_id,
     }
     mock_update.message.text = "-"
-    mock_miniflux_client.get_feed.side_effect = [
-        {"id": feed_id, "feed_url": original_url},
-        {"id": feed_id, "feed_url": expected_new_url},
-    ]
+    mock_miniflux_client.get_feed.return_value = {"id": feed_id, "feed_url": original_url}
 
     with patch(
         "src.handlers.messages.update_feed_url", return_value=(True, expected_new_url, None)
@@ -615,7 +682,7 @@ async def test_handle_message_awaiting_regex_remove(mock_update, mock_context, m
         await handle_message(mock_update, mock_context)
 
     # The merge time survives the regex removal
-    mock_update_api.assert_called_once_with(feed_id, expected_new_url, mock_miniflux_client)
+    mock_update_api.assert_called_once_with(feed_id, expected_new_url, mock_miniflux_client, original_url)
 
     assert mock_update.message.reply_text.call_count == 2
     assert f"Regex filter removed for channel @{channel_name}" in (
@@ -624,6 +691,32 @@ async def test_handle_message_awaiting_regex_remove(mock_update, mock_context, m
     assert "state" not in mock_context.user_data
 
 
+async def test_handle_awaiting_regex_reads_current_url_from_cached_feeds(
+    mock_update, mock_context, mock_miniflux_client
+):
+    """A feed present in the cached feed list needs no get_feed round-trip."""
+    channel_name = "cached_channel"
+    original_url = feed_url_for(channel_name, "?exclude_flags=fwd")
+    mock_miniflux_client.get_feeds.return_value = [{"id": 103, "feed_url": original_url}]
+    mock_context.user_data = {
+        "state": "awaiting_regex",
+        "editing_regex_for_channel": channel_name,
+        "editing_feed_id": 103,
+    }
+    mock_update.message.text = "spam"
+
+    with patch("src.handlers.messages.update_feed_url", return_value=(True, "url", None)) as mock_update_api:
+        await handle_message(mock_update, mock_context)
+
+    mock_miniflux_client.get_feed.assert_not_called()
+    mock_update_api.assert_called_once_with(
+        103, feed_url_for(channel_name, "?exclude_flags=fwd&exclude_text=spam"), mock_miniflux_client, original_url
+    )
+    keyboard = mock_update.message.reply_text.call_args_list[1].kwargs["reply_markup"]
+    labels = [button.text for row in keyboard.inline_keyboard for button in row]
+    assert 'Remove "fwd"' in " ".join(labels)
+
+
 async def test_handle_awaiting_regex_missing_context(mock_update, mock_context):
     """The state without its companion keys is a bug: say so and clear the state."""
     mock_context.user_data = {"state": "awaiting_regex"}
@@ -708,7 +801,7 @@ async def test_handle_awaiting_merge_time_success(mock_update, mock_context, moc
         await _handle_awaiting_merge_time(mock_update, mock_context)
 
     mock_update_api.assert_called_once_with(
-        feed_id, feed_url_for(channel_name, "?merge_seconds=300"), mock_miniflux_client
+        feed_id, feed_url_for(channel_name, "?merge_seconds=300"), mock_miniflux_client, feed_url_for(channel_name)
     )
     assert "updated to: 300 seconds" in mock_update.message.reply_text.call_args_list[0][0][0]
     assert "state" not in mock_context.user_data
@@ -730,7 +823,9 @@ async def test_handle_awaiting_merge_time_remove(mock_update, mock_context, mock
     with patch("src.handlers.messages.update_feed_url", return_value=(True, "url", None)) as mock_update_api:
         await _handle_awaiting_merge_time(mock_update, mock_context)
 
-    mock_update_api.assert_called_once_with(7, feed_url_for(channel_name), mock_miniflux_client)
+    mock_update_api.assert_called_once_with(
+        7, feed_url_for(channel_name), mock_miniflux_client, feed_url_for(channel_name, "?merge_seconds=600")
+    )
     assert "Merge time filter removed" in mock_update.message.reply_text.call_args_list[0][0][0]
 
 
@@ -857,7 +952,7 @@ async def test_handle_message_media_group_skipping(mock_update, mock_context):
     """Only the first message of a media group is processed."""
     media_group_id = "test_media_group_123"
     mock_update.message.media_group_id = media_group_id
-    mock_context.user_data["processed_media_group_id"] = media_group_id
+    messages._mark_media_group_processed(media_group_id)
 
     with patch("src.handlers.messages._parse_message_content", new=AsyncMock()) as mock_parse:
         await handle_message(mock_update, mock_context)
@@ -868,9 +963,9 @@ async def test_handle_message_media_group_skipping(mock_update, mock_context):
 
 
 async def test_handle_message_media_group_different_groups(mock_update, mock_context, mock_miniflux_client):
-    """A message from a new media group is processed and becomes the new marker."""
+    """A message from a new media group is processed and remembered."""
     mock_update.message.media_group_id = "media_group_1"
-    mock_context.user_data["processed_media_group_id"] = "previous_media_group"
+    messages._mark_media_group_processed("previous_media_group")
     mock_update.message.to_dict.return_value = {
         "forward_from_chat": {"id": 1, "title": "T", "username": "chan", "type": "channel"}
     }
@@ -879,10 +974,22 @@ async def test_handle_message_media_group_different_groups(mock_update, mock_con
     with patch("src.handlers.messages.fetch_categories", return_value=[{"id": 1, "title": "News"}]):
         await handle_message(mock_update, mock_context)
 
-    assert mock_context.user_data["processed_media_group_id"] == "media_group_1"
+    assert "media_group_1" in messages._processed_media_groups
+    # The earlier group is still remembered: a late message from it stays skipped
+    assert "previous_media_group" in messages._processed_media_groups
     mock_update.message.reply_text.assert_called_once()
 
 
+def test_media_group_memory_is_bounded(monkeypatch):
+    """Beyond the bound, the oldest media group is forgotten first."""
+    monkeypatch.setattr(messages, "MEDIA_GROUP_MEMORY_SIZE", 2)
+
+    for media_group_id in ("a", "b", "c"):
+        messages._mark_media_group_processed(media_group_id)
+
+    assert list(messages._processed_media_groups) == ["b", "c"]
+
+
 # --- _handle_telegram_channel error paths -----------------------------------
 
 
@@ -969,8 +1076,12 @@ async def test_button_callback_select_category(mock_update, mock_context, mock_m
     mock_miniflux_client.create_feed.assert_called_once_with(
         feed_url_for("test_channel"), category_id=1
     )
-    mock_update.callback_query.edit_message_text.assert_called_once()
-    assert "subscribed" in mock_update.callback_query.edit_message_text.call_args[0][0].lower()
+    # A progress message replaces the category buttons while Miniflux fetches the feed
+    edits = mock_update.callback_query.edit_message_text.call_args_list
+    assert len(edits) == 2
+    assert edits[0][0][0] == SUBSCRIBING_MESSAGE
+    assert edits[0][1]["reply_markup"] is None
+    assert "subscribed" in edits[1][0][0].lower()
     assert "channel_title" not in mock_context.user_data
 
 
@@ -67,6 +67,7 @@ async def test_channel_regex_filter_flow(mock_update, mock_context, mock_miniflu
 
     # Phase 4: send the regex
     mock_update.message.text = "unwanted|spam"
+    mock_update.message.to_dict.return_value = {"text": mock_update.message.text}
     mock_miniflux_client.get_feed.return_value = {"feed_url": feed_url_for("test_channel")}
 
     with patch("src.handlers.messages.update_feed_url", return_value=(True, "url", None)) as mock_update_url:
@@ -74,11 +75,8 @@ async def test_channel_regex_filter_flow(mock_update, mock_context, mock_miniflu
 
     assert "state" not in mock_context.user_data
     mock_update_url.assert_called_once()
-    success_messages = [
-        call[0][0]
-        for call in mock_update.message.reply_text.call_args_list
-        if "regex" in call[0][0].lower() and "updated" in call[0][0].lower()
-    ]
+    replies = [call[0][0].lower() for call in mock_update.message.reply_text.call_args_list]
+    success_messages = [text for text in replies if "regex" in text and "updated" in text]
     assert success_messages
 
 
@@ -127,11 +125,8 @@ async def test_error_recovery_miniflux_api(mock_update, mock_context, mock_minif
     ), patch("src.handlers.messages.fetch_categories", return_value=[{"id": 1, "title": "News"}]):
         # First attempt fails during the subscription check
         await handle_message(mock_update, mock_context)
-        error_messages = [
-            call[0][0]
-            for call in mock_update.message.reply_text.call_args_list
-            if "failed" in call[0][0].lower() or "error" in call[0][0].lower()
-        ]
+        replies = [call[0][0].lower() for call in mock_update.message.reply_text.call_args_list]
+        error_messages = [text for text in replies if "failed" in text or "error" in text]
         assert error_messages
         mock_update.message.reply_text.reset_mock()
 
@@ -1,6 +1,6 @@
 """Tests for src/miniflux_api.py — the synchronous Miniflux API layer."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
@@ -14,8 +14,12 @@ from src.miniflux_api import (
     fetch_categories,
     find_feed_by_channel,
     get_channels_by_category,
+    get_feed_by_id,
+    invalidate_feeds_cache,
     update_feed_url,
 )
+from src.settings import settings
+from src.url_constructor import _parse_query_components
 
 
 # The library exceptions take a response object; these stand-ins keep the tests
@@ -95,6 +99,35 @@ def test_fetch_categories_api_error(client, mock_response):
         fetch_categories(client)
 
 
+def test_fetch_categories_cached_within_ttl(client):
+    """A second subscription within the TTL reuses the fetched list."""
+    client.get_categories.return_value = [{"id": 1, "title": "News"}]
+
+    first = fetch_categories(client)
+    second = fetch_categories(client)
+
+    assert second is first
+    client.get_categories.assert_called_once()
+
+
+def test_fetch_categories_refetched_after_ttl(client):
+    client.get_categories.side_effect = [[{"id": 1, "title": "Old"}], [{"id": 2, "title": "New"}]]
+
+    with patch("src.miniflux_api.time.monotonic", side_effect=[0.0, 400.0, 400.0]):
+        fetch_categories(client)
+        assert fetch_categories(client) == [{"id": 2, "title": "New"}]
+
+    assert client.get_categories.call_count == 2
+
+
+def test_fetch_categories_error_not_cached(client, mock_response):
+    client.get_categories.side_effect = [ClientError(mock_response), [{"id": 1, "title": "News"}]]
+
+    with pytest.raises(ClientError):
+        fetch_categories(client)
+    assert fetch_categories(client) == [{"id": 1, "title": "News"}]
+
+
 # --- check_feed_exists ------------------------------------------------------
 
 
@@ -119,6 +152,23 @@ def test_check_feed_exists_false(client):
     client.get_feeds.assert_called_once()
 
 
+def test_check_feed_exists_reuses_url_set(client):
+    """Repeated checks share one fetch and one URL set; a mutation drops both."""
+    client.get_feeds.side_effect = [
+        [{"id": 1, "feed_url": "http://a/rss"}],
+        [{"id": 1, "feed_url": "http://a/rss"}, {"id": 2, "feed_url": "http://b/rss"}],
+    ]
+
+    assert check_feed_exists(client, "http://a/rss") is True
+    assert check_feed_exists(client, "http://b/rss") is False
+    client.get_feeds.assert_called_once()
+
+    create_feed(client, "http://b/rss", 1)
+
+    assert check_feed_exists(client, "http://b/rss") is True
+    assert client.get_feeds.call_count == 2
+
+
 def test_check_feed_exists_api_error(client, mock_response):
     mock_response.status_code = 503
     client.get_feeds.side_effect = ClientError(mock_response)
@@ -169,6 +219,74 @@ def test_find_feed_by_channel_not_found(client, mocker):
     assert find_feed_by_channel(client, "missing") is None
 
 
+def test_find_feed_by_channel_parses_feed_list_once(client, mocker):
+    """Repeated lookups against the same cached feed list reuse one channel index."""
+    feeds = [
+        {"id": 1, "feed_url": "http://b/rss/one"},
+        {"id": 2, "feed_url": "http://b/rss/two"},
+    ]
+    client.get_feeds.return_value = feeds
+    mock_parse = mocker.patch(
+        "src.miniflux_api.parse_feed_url",
+        side_effect=lambda url: {"channel_name": url.rsplit("/", 1)[-1]},
+    )
+
+    assert find_feed_by_channel(client, "one") == feeds[0]
+    assert find_feed_by_channel(client, "TWO") == feeds[1]
+    assert find_feed_by_channel(client, "three") is None
+
+    assert mock_parse.call_count == len(feeds)
+
+
+def test_find_feed_by_channel_index_dropped_on_invalidation(client, mocker):
+    """A mutation invalidates the feed list and the index built from it."""
+    client.get_feeds.side_effect = [
+        [{"id": 1, "feed_url": "http://b/rss/old"}],
+        [{"id": 2, "feed_url": "http://b/rss/new"}],
+    ]
+    mocker.patch(
+        "src.miniflux_api.parse_feed_url",
+        side_effect=lambda url: {"channel_name": url.rsplit("/", 1)[-1]},
+    )
+
+    assert find_feed_by_channel(client, "new") is None
+    invalidate_feeds_cache()
+    assert find_feed_by_channel(client, "new") == {"id": 2, "feed_url": "http://b/rss/new"}
+
+
+def test_get_feed_by_id_serves_cached_feed(client):
+    client.get_feeds.return_value = [{"id": 1, "feed_url": "http://b/rss/a"}]
+
+    assert get_feed_by_id(client, 1) == {"id": 1, "feed_url": "http://b/rss/a"}
+    client.get_feed.assert_not_called()
+
+
+def test_get_feed_by_id_falls_back_to_api(client):
+    """A feed missing from the cached list is fetched directly."""
+    client.get_feeds.return_value = []
+    client.get_feed.return_value = {"id": 2, "feed_url": "http://b/rss/b"}
+
+    assert get_feed_by_id(client, 2) == {"id": 2, "feed_url": "http://b/rss/b"}
+    client.get_feed.assert_called_once_with(2)
+
+
+def test_feed_urls_parsed_once_across_list_and_lookup(client):
+    """/list and a channel lookup over the same feeds share one query parse per URL."""
+    bridge = "http://b/rss/{channel}/tok"
+    feeds = [
+        {"id": i, "feed_url": f"http://b/rss/chan{i}/tok?exclude_flags=fwd&n={i}", "category": {"id": 1, "title": "C"}}
+        for i in range(3)
+    ]
+    client.get_feeds.return_value = feeds
+    _parse_query_components.cache_clear()
+
+    with patch.object(settings, "rss_bridge_url", bridge):
+        get_channels_by_category(client, bridge)
+        find_feed_by_channel(client, "chan1")
+
+    assert _parse_query_components.cache_info().misses == len(feeds)
+
+
 # --- update_feed_url --------------------------------------------------------
 
 
@@ -182,6 +300,15 @@ def test_update_feed_url_success(client):
     client.update_feed.assert_called_once_with(123, feed_url="http://new.url/feed")
 
 
+def test_update_feed_url_trusts_the_write(client):
+    """The write is not followed by a sleep and a get_feed verification round-trip."""
+    with patch("time.sleep") as mock_sleep:
+        update_feed_url(123, "http://new.url/feed", client)
+
+    mock_sleep.assert_not_called()
+    client.get_feed.assert_not_called()
+
+
 def test_update_feed_url_client_error(client):
     error_reason = "Invalid URL format from API"
     client.update_feed.side_effect = ClientError(error_reason)
@@ -217,6 +344,23 @@ def test_update_feed_url_unchanged_url_is_still_an_update(client):
     client.update_feed.assert_called_once_with(42, feed_url=current_url)
 
 
+def test_update_feed_url_skips_call_when_current_url_matches(client):
+    """A caller that knows the current URL gets no API round-trip for a no-op update."""
+    current_url = "http://rssbridge.example.com/rss/chan/token?exclude_flags=fwd"
+
+    success, updated_url, error_message = update_feed_url(42, current_url, client, current_url)
+
+    assert (success, updated_url, error_message) == (True, current_url, None)
+    client.update_feed.assert_not_called()
+
+
+def test_update_feed_url_calls_api_when_current_url_differs(client):
+    success, _url, _err = update_feed_url(42, "http://new/url", client, "http://old/url")
+
+    assert success is True
+    client.update_feed.assert_called_once_with(42, feed_url="http://new/url")
+
+
 # --- delete_feed ------------------------------------------------------------
 
 
@@ -273,6 +417,39 @@ def test_get_channels_by_category_structure(mocker, client):
     assert result["Unknown"][0]["title"] == "ChanE No Category"
 
 
+def test_get_channels_by_category_sorted_case_insensitively(mocker, client):
+    """Categories and the feeds inside each are ordered by title, ignoring case."""
+    client.get_feeds.return_value = [
+        {"id": 1, "feed_url": "http://b/rss/z", "title": "zeta", "category": {"id": 2, "title": "beta"}},
+        {"id": 2, "feed_url": "http://b/rss/a", "title": "Alpha", "category": {"id": 1, "title": "Alpha"}},
+        {"id": 3, "feed_url": "http://b/rss/b", "title": "Beta", "category": {"id": 2, "title": "beta"}},
+    ]
+    mocker.patch(
+        "src.miniflux_api.parse_feed_url",
+        return_value={"channel_name": "chan", "flags": None, "exclude_text": None, "merge_seconds": None},
+    )
+
+    result = get_channels_by_category(client, "http://b/rss/{channel}")
+
+    assert list(result) == ["Alpha", "beta"]
+    assert [item["title"] for item in result["beta"]] == ["Beta", "zeta"]
+
+
+def test_get_channels_by_category_null_category(mocker, client):
+    """A feed whose category is null is grouped under "Unknown" instead of failing."""
+    client.get_feeds.return_value = [
+        {"id": 1, "feed_url": "http://b/rss/a", "title": "A", "category": None},
+    ]
+    mocker.patch(
+        "src.miniflux_api.parse_feed_url",
+        return_value={"channel_name": "a", "flags": None, "exclude_text": None, "merge_seconds": None},
+    )
+
+    result = get_channels_by_category(client, "http://b/rss/{channel}")
+
+    assert [item["title"] for item in result["Unknown"]] == ["A"]
+
+
 def test_get_channels_by_category_no_bridge_feeds(mocker, client):
     """No feed matches the bridge base URL: nothing is even parsed."""
     client.get_feeds.return_value = [
@@ -22,6 +22,10 @@ class MockResponse:
         return {"error_message": self.message}
 
 
+# Responses are only read by the miniflux exceptions, so one instance can be shared.
+INTERNAL_ERROR_RESPONSE = MockResponse(status_code=500, message="Internal Server Error")
+
+
 @pytest.fixture
 def mock_client():
     """A synchronous mock of the miniflux client (the library is not async)."""
@@ -34,7 +38,7 @@ def mock_client():
 def test_update_feed_url_handles_server_error(mock_client):
     """A server error is reported once, with its status code — no retry."""
     mock_client.update_feed = MagicMock(
-        side_effect=ServerError(MockResponse(status_code=500, message="Internal Server Error"))
+        side_effect=ServerError(INTERNAL_ERROR_RESPONSE)
     )
 
     success, updated_url, error_message = update_feed_url(
@@ -96,7 +100,7 @@ def test_delete_feed_handles_client_error(mock_client):
 
 def test_delete_feed_handles_server_error(mock_client):
     mock_client.delete_feed = MagicMock(
-        side_effect=ServerError(MockResponse(status_code=500, message="Internal Server Error"))
+        side_effect=ServerError(INTERNAL_ERROR_RESPONSE)
     )
 
     success, error_message = delete_feed(mock_client, 42)
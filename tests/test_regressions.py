@@ -4,6 +4,7 @@ Each test here is the proof that a specific "glitch" is gone. They are written t
 fail loudly if the corresponding bug is reintroduced.
 """
 
+import threading
 import warnings
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,7 +14,12 @@ from telegram.error import BadRequest
 import src.handlers.keyboards as keyboards
 from src.handlers.callbacks import _handle_delete_channel, _handle_flag_toggle, button_callback
 from src.handlers.common import safe_edit_message
-from src.handlers.keyboards import build_options_view, create_flag_keyboard, get_available_flags
+from src.handlers.keyboards import (
+    build_category_keyboard,
+    build_options_view,
+    create_flag_keyboard,
+    get_available_flags,
+)
 
 # Bound at import time, before the autouse patch_available_flags fixture replaces
 # the module attribute — this stays the genuine function.
@@ -133,6 +139,21 @@ async def test_flag_toggle_edits_once_on_update_failure(mock_query, mock_context
     assert mock_query.edit_message_text.call_count == 1
 
 
+async def test_flag_toggle_double_tap_reads_the_cached_feed_list(mock_query, mock_context, mock_miniflux_client):
+    """A repeated tap ("already set") resolves the feed from the cached list: no get_feed, one get_feeds."""
+    channel = "test_channel"
+    mock_miniflux_client.get_feeds.return_value = [
+        {"id": 5, "feed_url": feed_url_for(channel, "?exclude_flags=video")}
+    ]
+
+    await _handle_flag_toggle(mock_query, mock_context, "add", "video", channel)
+    await _handle_flag_toggle(mock_query, mock_context, "add", "video", channel)
+
+    mock_miniflux_client.get_feeds.assert_called_once()
+    mock_miniflux_client.get_feed.assert_not_called()
+    assert "already set" in mock_query.edit_message_text.call_args[0][0]
+
+
 # --- Bug: a failed flag fetch fabricated a fake "no_get_flags" flag -----------
 
 
@@ -311,6 +332,43 @@ async def test_create_flag_keyboard_is_async_and_renders_toggles():
     assert any("Edit Regex" in label for label in labels)
 
 
+async def test_create_flag_keyboard_lays_out_flags_in_pairs():
+    """Flag toggles come two per row; an odd flag count leaves a single-button last row."""
+    keyboard = await create_flag_keyboard(
+        "chan", current_flags=None, available_flags=["a", "b", "c"]
+    )
+
+    flag_rows = keyboard[:-3]  # regex, merge time and delete rows follow the toggles
+    assert [len(row) for row in flag_rows] == [2, 1]
+    assert [button.callback_data for row in flag_rows for button in row] == [
+        "add_flag|chan|a", "add_flag|chan|b", "add_flag|chan|c",
+    ]
+
+
+async def test_build_options_view_reuses_markup_for_same_state():
+    """The same channel state yields the same (immutable) markup object; flag order is irrelevant."""
+    first, _ = await build_options_view("chan", ["video", "fwd"], 60)
+    second, _ = await build_options_view("chan", ["fwd", "video"], 60)
+    other, _ = await build_options_view("chan", ["fwd"], 60)
+
+    assert first is second
+    assert other is not first
+
+
+def test_build_category_keyboard_reuses_markup_for_same_list():
+    """The cached category list maps to one keyboard; a new list rebuilds it."""
+    categories = [{"id": 1, "title": "News"}, {"id": 2, "title": "Tech"}]
+
+    first, first_dict = build_category_keyboard(categories)
+    second, second_dict = build_category_keyboard(categories)
+    other, other_dict = build_category_keyboard([{"id": 3, "title": "Misc"}])
+
+    assert second is first and second_dict is first_dict
+    assert first_dict == {1: "News", 2: "Tech"}
+    assert other is not first
+    assert other_dict == {3: "Misc"}
+
+
 async def test_get_available_flags_caches(monkeypatch):
     """get_available_flags fetches once and serves the cache on the next call."""
     keyboards._flags_cache = None
@@ -325,6 +383,42 @@ async def test_get_available_flags_caches(monkeypatch):
     first = await get_available_flags()
     second = await get_available_flags()
 
-    assert first == second == ["video"]
+    assert first == second == ("video",)
+    # The cached tuple itself is handed out: no per-press copy
+    assert first is second
     assert calls["n"] == 1
     keyboards._flags_cache = None
+
+
+# --- Bug: a blocking Miniflux call stalls every handler ----------------------
+
+
+async def test_miniflux_calls_never_run_on_the_event_loop_thread(mock_update, mock_context, mock_miniflux_client):
+    """Every Miniflux call made by the handlers runs in a worker thread.
+
+    The client is synchronous: a call made directly on the loop thread would block
+    all other updates until Miniflux answers.
+    """
+    loop_thread = threading.current_thread()
+    call_threads = []
+
+    def record(result):
+        def method(*_args, **_kwargs):
+            call_threads.append(threading.current_thread())
+            return result
+        return method
+
+    feed = {"id": 5, "feed_url": feed_url_for("chan", "?exclude_flags=fwd")}
+    mock_miniflux_client.get_feeds.side_effect = record([feed])
+    mock_miniflux_client.get_feed.side_effect = record(feed)
+    mock_miniflux_client.update_feed.side_effect = record(None)
+    mock_miniflux_client.delete_feed.side_effect = record(None)
+
+    mock_update.message.text = "@chan"
+    await handle_message(mock_update, mock_context)
+    for data in ("manage|chan", "add_flag|chan|video", "edit_regex|chan", "delete|chan"):
+        mock_update.callback_query.data = data
+        await button_callback(mock_update, mock_context)
+
+    assert call_threads
+    assert all(thread is not loop_thread for thread in call_threads)
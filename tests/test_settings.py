@@ -4,7 +4,7 @@ Replaces the old tests/test_config.py: `load_config()` / `initialize_miniflux_cl
 are gone; configuration is now a pydantic-settings model validated at startup.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
@@ -242,7 +242,7 @@ def test_get_client_with_api_key(monkeypatch, reset_client_cache):
         REAL_GET_CLIENT()
 
     mock_client_class.assert_called_once_with(
-        "http://miniflux.example.com", api_key="test_api_key"
+        "http://miniflux.example.com", api_key="test_api_key", session=ANY
     )
 
 
@@ -257,7 +257,7 @@ def test_get_client_with_username_password(monkeypatch, reset_client_cache):
         REAL_GET_CLIENT()
 
     mock_client_class.assert_called_once_with(
-        "http://miniflux.example.com", username="test_user", password="test_password"
+        "http://miniflux.example.com", username="test_user", password="test_password", session=ANY
     )
 
 
@@ -271,3 +271,17 @@ def test_get_client_is_cached(monkeypatch, reset_client_cache):
 
     assert first is second
     mock_client_class.assert_called_once()
+
+
+def test_get_client_uses_dedicated_pooled_session(monkeypatch, reset_client_cache):
+    """Each client gets its own keep-alive session sized for concurrent worker threads."""
+    monkeypatch.setattr(settings, "miniflux_api_key", "test_api_key")
+
+    with patch("miniflux.Client") as mock_client_class, \
+         patch("src.miniflux_api.HTTPAdapter") as mock_adapter_class:
+        REAL_GET_CLIENT()
+
+    mock_adapter_class.assert_called_once_with(pool_connections=1, pool_maxsize=miniflux_api.HTTP_POOL_SIZE)
+    session = mock_client_class.call_args.kwargs["session"]
+    assert session.get_adapter("https://miniflux.example.com") is mock_adapter_class.return_value
+    assert session.get_adapter("http://miniflux.example.com") is mock_adapter_class.return_value
@@ -108,6 +108,18 @@ from src.url_constructor import build_feed_url, parse_feed_url
                 "merge_seconds": 10,
             },
         ),
+        # A repeated parameter: the first occurrence wins; the fragment is dropped
+        (
+            "http://test.bridge/rss/chan?merge_seconds=30&exclude_flags=fwd&merge_seconds=60#top",
+            "chan",
+            {
+                "base_url": "http://test.bridge/rss/chan",
+                "channel_name": "chan",
+                "flags": ["fwd"],
+                "exclude_text": None,
+                "merge_seconds": 30,
+            },
+        ),
         # exclude_text with URL-encoded Russian characters ('|' is %7C)
         (
             "http://test.bridge/rss/channelRus?exclude_text=%D1%80%D0%B5%D0%BA%D0%BB%D0%B0%D0%BC%D0%B0%7C%D1%81%D0%BF%D0%B0%D0%BC%7C%D1%81%D0%B1%D0%BE%D1%80%7C%D0%BF%D0%BE%D0%B4%D0%BF%D0%B8%D1%81%D0%BA%D0%B0",
@@ -135,6 +147,17 @@ def test_parse_feed_url(mocker, feed_url, mock_channel, expected_result):
     mock_extract.assert_called_once_with(feed_url)
 
 
+def test_parse_feed_url_returns_fresh_flags_list(mocker):
+    """The per-URL parse is memoized, but each call hands out its own flags list."""
+    mocker.patch("src.url_constructor.extract_channel_from_feed_url", return_value="chan")
+    feed_url = "http://test.bridge/rss/chan?exclude_flags=fwd,video"
+
+    first = parse_feed_url(feed_url)
+    first["flags"].append("poll")
+
+    assert parse_feed_url(feed_url)["flags"] == ["fwd", "video"]
+
+
 # --- build_feed_url ---------------------------------------------------------
 
 
@@ -201,6 +224,13 @@ def test_parse_feed_url(mocker, feed_url, mock_channel, expected_result):
             None, "русский текст", None,
             "http://test.bridge/rss/channel10?exclude_text=%D1%80%D1%83%D1%81%D1%81%D0%BA%D0%B8%D0%B9%20%D1%82%D0%B5%D0%BA%D1%81%D1%82",
         ),
+        # exclude_text with a comma and a slash: quote's default encoding (the slash
+        # stays literal, the comma is %2C), as existing subscriptions were built
+        (
+            "http://test.bridge/rss/channel11", "channel11",
+            None, "a{1,3}/b", None,
+            "http://test.bridge/rss/channel11?exclude_text=a%7B1%2C3%7D/b",
+        ),
         # exclude_text with Russian characters and a pipe (must encode as %7C)
         (
             "http://test.bridge/rss/channelRusPipe", "channelRusPipe",
@@ -238,3 +268,16 @@ def test_parse_and_build_round_trip(mocker):
     )
 
     assert parse_feed_url(rebuilt) == parsed
+
+
+def test_rebuild_of_unchanged_feed_is_byte_identical(mocker):
+    """An existing subscription rebuilds to the very same string, so no update is sent."""
+    mocker.patch("src.url_constructor.extract_channel_from_feed_url", return_value="chan")
+    original = "http://test.bridge/rss/chan?exclude_flags=fwd,video&exclude_text=a%7B1%2C3%7D/b%20c&merge_seconds=300"
+
+    parsed = parse_feed_url(original)
+    rebuilt = build_feed_url(
+        parsed["base_url"], parsed["channel_name"], parsed["flags"], parsed["exclude_text"], parsed["merge_seconds"]
+    )
+
+    assert rebuilt == original
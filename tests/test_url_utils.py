@@ -8,6 +8,7 @@ import requests
 from src.settings import settings
 from src.url_utils import (
     TELEGRAM_LINK_RE,
+    _extract_channel,
     extract_channel_from_feed_url,
     extract_rss_links_from_html,
     is_valid_rss_url,
@@ -53,6 +54,15 @@ def test_parse_telegram_link_private_channel_c_form():
     assert parse_telegram_link("https://t.me/c/1234567890") == "1234567890"
 
 
+def test_parse_telegram_link_skips_regex_without_link():
+    """Text that cannot hold a t.me link never reaches the regex."""
+    with patch("src.url_utils.TELEGRAM_LINK_RE") as mock_re:
+        assert parse_telegram_link("just some words, no link here") is None
+        assert parse_telegram_link("https://example.com/feed.xml") is None
+
+    mock_re.search.assert_not_called()
+
+
 def test_parse_telegram_link_inside_surrounding_text():
     """The link is found anywhere inside the message text, not only at the start."""
     assert parse_telegram_link("Check this out https://t.me/durov/123 — nice") == "durov"
@@ -197,6 +207,31 @@ def test_extract_channel_from_feed_url_mismatched_url():
     assert extract_channel_from_feed_url("http://different.domain.com/rss/test_channel") is None
 
 
+def test_extract_channel_from_feed_url_mismatch_formats_nothing():
+    """A non-bridge feed is rejected without formatting the (disabled) debug message."""
+    with patch("src.url_utils.logging.debug") as mock_debug:
+        assert extract_channel_from_feed_url("http://different.domain.com/rss/test_channel") is None
+
+    mock_debug.assert_called_once_with(
+        "Feed URL '%s' does not match the configured RSS_BRIDGE_URL pattern.",
+        "http://different.domain.com/rss/test_channel",
+    )
+
+
+def test_extract_channel_from_feed_url_memoized_per_template(monkeypatch):
+    """A URL is resolved once per bridge template; a new template is not served stale results."""
+    feed_url = "http://bridge-a.local/rss/memo_channel"
+    monkeypatch.setattr(settings, "rss_bridge_url", "http://bridge-a.local/rss/{channel}")
+
+    assert extract_channel_from_feed_url(feed_url) == "memo_channel"
+    assert extract_channel_from_feed_url(feed_url) == "memo_channel"
+    # The cache is cleared around every test (see conftest), so the counts are exact
+    assert _extract_channel.cache_info()[:2] == (1, 1)
+
+    monkeypatch.setattr(settings, "rss_bridge_url", "http://bridge-b.local/rss/{channel}")
+    assert extract_channel_from_feed_url(feed_url) is None
+
+
 def test_extract_channel_from_feed_url_not_matching_pattern(monkeypatch):
     """URLs that resemble the bridge but do not match its base prefix yield None."""
     monkeypatch.setattr(